@@ -2,37 +2,51 @@
 Sentify Backend - Flask API Server
 Provides real market data and dual-model sentiment analysis
 """
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, g, Response
 from flask_cors import CORS
 import yfinance as yf
 from newsapi import NewsApiClient
+from newsapi import const as newsapi_const
 from dotenv import load_dotenv
 import os
+import logging
+import sqlite3
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 import requests
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch
-import torch.nn.functional as F
+from logging_setup import configure_logging
+from profiling import init_profiling
+from provider_health import CircuitOpenError, get_health, order_providers, health_snapshot
+from symbol_index import load_symbol_index, normalize as normalize_symbol_text
+from records import ArticleBatch, ScoreBatch, article_id, scoring_text
+from chunking import POOLING_METHODS
+from finbert import load_model, finbert_probabilities_batch
+from relevance import COMMON_NAMES, is_relevant_news
+from responses import CachedBody, init_responses, request_json
+from sentiment_store import SentimentStore
+from metrics import (
+    render as render_metrics, span, trace_stage, HTTP_REQUEST_SECONDS, CACHE_REQUESTS, PROVIDER_REQUEST_SECONDS,
+    PROVIDER_REQUESTS, PROVIDER_EMPTY_RESULTS, FINBERT_BATCH_SIZE, FINBERT_SECONDS_PER_TEXT
+)
 
 # Load environment variables
 load_dotenv()
+configure_logging()
+logger = logging.getLogger('sentify')
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
+init_responses(app)  # Fast JSON, gzip/brotli and ETags for all endpoints
+init_profiling(app)  # No-op unless PROFILING_ENABLED=1
 
-# Initialize FinBERT model for sentiment analysis
-print("Loading FinBERT model...")
-try:
-    finbert_tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
-    finbert_model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
-    finbert_model.eval()
-    print("[OK] FinBERT model loaded successfully")
-    FINBERT_AVAILABLE = True
-except Exception as e:
-    print(f"[WARNING] FinBERT model failed to load: {e}")
-    FINBERT_AVAILABLE = False
+# Initialize FinBERT model for sentiment analysis (finbert.py; honours TORCH_NUM_THREADS)
+FINBERT_AVAILABLE = load_model()
 
 # Initialize News API clients
 NEWS_API_KEY = os.getenv('NEWS_API_KEY')
@@ -42,12 +56,24 @@ FINNHUB_API_KEY_2 = os.getenv('FINNHUB_API_KEY_2')  # Fallback key
 NEWSDATA_API_KEY = os.getenv('NEWSDATA_API_KEY')
 POLYGON_API_KEY = os.getenv('POLYGON_API_KEY')
 
+# Provider base URLs (overridable so benchmarks can point at local mock servers)
+FINNHUB_BASE_URL = os.getenv('FINNHUB_BASE_URL', 'https://finnhub.io/api/v1')
+ALPHA_VANTAGE_BASE_URL = os.getenv('ALPHA_VANTAGE_BASE_URL', 'https://www.alphavantage.co')
+NEWSDATA_BASE_URL = os.getenv('NEWSDATA_BASE_URL', 'https://newsdata.io/api/1')
+POLYGON_BASE_URL = os.getenv('POLYGON_BASE_URL', 'https://api.polygon.io')
+NEWSAPI_BASE_URL = os.getenv('NEWSAPI_BASE_URL')
+if NEWSAPI_BASE_URL:
+    newsapi_const.EVERYTHING_URL = f"{NEWSAPI_BASE_URL}/everything"
+
+# Set DISABLE_YFINANCE=1 to skip Yahoo Finance lookups (offline runs, benchmarks)
+YFINANCE_ENABLED = os.getenv('DISABLE_YFINANCE', '').lower() not in ('1', 'true', 'yes')
+
 if NEWS_API_KEY:
     newsapi = NewsApiClient(api_key=NEWS_API_KEY)
-    print("[OK] NewsAPI configured")
+    logger.info("NewsAPI configured")
 else:
     newsapi = None
-    print("[WARNING] NEWS_API_KEY not found")
+    logger.warning("NEWS_API_KEY not found")
 
 # Log available APIs
 api_status = []
@@ -64,68 +90,164 @@ if POLYGON_API_KEY:
 if NEWSDATA_API_KEY:
     api_status.append("NewsData")
 
-print(f"[OK] Active news sources: {', '.join(api_status) if api_status else 'None - using mock data'}")
+logger.info("Active news sources: %s", ', '.join(api_status) if api_status else 'None - using mock data')
 
 # Cache for ticker data to avoid rate limiting
 ticker_cache = {}
 news_cache = {}
-CACHE_DURATION = 300  # Cache for 5 minutes for real-time feel
+CACHE_DURATION = int(os.getenv('CACHE_DURATION', '300'))  # Cache for 5 minutes for real-time feel
+# FinBERT results by (text digest, pooling) so a text is scored once and /api/news can
+# return an article's score inline; least recently used entries are dropped past SCORE_CACHE_SIZE.
+# Keys come only from the scored text, so a client can never choose which article a score attaches to.
+finbert_score_cache = OrderedDict()
+finbert_score_lock = threading.Lock()
+SCORE_CACHE_SIZE = int(os.getenv('SCORE_CACHE_SIZE', '50000'))
+# Article summaries are cut to this many characters; 0 keeps the full text (long texts are chunked for FinBERT)
+SUMMARY_MAX_CHARS = int(os.getenv('SUMMARY_MAX_CHARS', '500'))
+
+# Local symbol list for /api/search (see symbol_index.py); quotes still come from the network
+SYMBOL_INDEX = load_symbol_index(os.getenv('SYMBOL_LIST_PATH'))
+logger.info("Symbol index loaded: %d symbols", len(SYMBOL_INDEX))
+# Quote lookups for search results run in parallel
+search_quote_executor = ThreadPoolExecutor(max_workers=int(os.getenv('SEARCH_QUOTE_WORKERS', '8')),
+                                           thread_name_prefix='search-quote')
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    started = getattr(g, 'request_started', None)
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint,
+                                     method=request.method, status=str(response.status_code))
+    return response
+
+
+def text_digest(text):
+    # surrogatepass: JSON bodies may carry lone surrogates (e.g. a JS substring cut inside an emoji)
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+
 
+def get_cached_score(digest, pooling='mean'):
+    """Cached FinBERT probabilities for the text with this digest, or None"""
+    key = (digest, pooling)
+    with finbert_score_lock:
+        probabilities = finbert_score_cache.get(key)
+        if probabilities is not None:
+            finbert_score_cache.move_to_end(key)
+        return probabilities
 
-def is_relevant_news(article, symbol, company_name=None):
+
+def store_cached_score(digest, pooling, probabilities):
+    key = (digest, pooling)
+    with finbert_score_lock:
+        finbert_score_cache[key] = array('f', probabilities)
+        finbert_score_cache.move_to_end(key)
+        while len(finbert_score_cache) > SCORE_CACHE_SIZE:
+            finbert_score_cache.popitem(last=False)
+
+
+def attach_cached_scores(batch):
     """
-    Filter news articles to ensure they are directly relevant to the specific company
-    Returns True if article mentions the company/ticker prominently
+    Fill in FinBERT scores cached since the batch was built; True if any were added.
+    Looked up by the digest of each article's own scoring text (records.scoring_text).
     """
-    title = article.get('title', '').lower()
-    summary = article.get('summary', '').lower()
-    combined_text = f"{title} {summary}"
-    
-    symbol_lower = symbol.lower()
-    
-    # Check if ticker symbol appears in title or summary
-    if symbol_lower in combined_text:
-        return True
-    
-    # If we have company name, check for it
-    if company_name:
-        company_lower = company_name.lower()
-        # Check for full company name or significant parts
-        company_words = company_lower.split()
-        
-        # For short company names (1-2 words), require exact match
-        if len(company_words) <= 2:
-            if company_lower in combined_text:
-                return True
-        else:
-            # For longer names, check if at least 2 key words appear
-            matches = sum(1 for word in company_words if len(word) > 3 and word in combined_text)
-            if matches >= 2:
-                return True
-    
-    # Additional check: if title contains the symbol as a word (not part of another word)
-    import re
-    if re.search(rf'\b{re.escape(symbol_lower)}\b', title):
-        return True
+    added = False
+    for i, present in enumerate(batch.scores.present):
+        if not present:
+            probabilities = get_cached_score(text_digest(scoring_text(batch.titles[i], batch.summaries[i])))
+            if probabilities is not None:
+                batch.scores.set(i, probabilities)
+                added = True
+    return added
+
+
+def batch_response(batch, body=None):
+    """
+    Serve an ArticleBatch/ScoreBatch as JSON, or NDJSON if the client asks for it.
+    `body` is the batch's pre-serialized JSON (a CachedBody) when it came from a cache.
+    """
+    if request.args.get('format') == 'ndjson' or 'application/x-ndjson' in request.headers.get('Accept', ''):
+        return CachedBody(batch.to_ndjson().encode('utf-8'), mimetype='application/x-ndjson').response()
+    return (body or CachedBody(batch.to_json().encode('utf-8'))).response()
+
+
+def provider_get(provider, url, key='key1', timeout=10):
+    """
+    GET an upstream provider URL, recording latency and outcome per provider/key.
+    Raises CircuitOpenError without calling out if the circuit for this provider key is open.
+    """
+    health = get_health(provider)
+    if not health.acquire(key):
+        PROVIDER_REQUESTS.inc(provider=provider, key=key, outcome='circuit_open')
+        raise CircuitOpenError(f"{provider} {key} circuit open")
     
-    return False
+    started = time.perf_counter()
+    try:
+        response = requests.get(url, timeout=timeout)
+    except Exception:
+        elapsed = time.perf_counter() - started
+        PROVIDER_REQUEST_SECONDS.observe(elapsed, provider=provider, key=key)
+        PROVIDER_REQUESTS.inc(provider=provider, key=key, outcome='exception')
+        trace_stage(f"provider:{provider}", elapsed)
+        health.record_failure(elapsed, key)
+        raise
+    elapsed = time.perf_counter() - started
+    PROVIDER_REQUEST_SECONDS.observe(elapsed, provider=provider, key=key)
+    trace_stage(f"provider:{provider}", elapsed)
+    if response.status_code == 429:
+        outcome = 'rate_limited'
+    elif response.status_code >= 400:
+        outcome = 'http_error'
+    else:
+        outcome = 'ok'
+    PROVIDER_REQUESTS.inc(provider=provider, key=key, outcome=outcome)
+    if outcome == 'ok':
+        health.record_success(elapsed, key)
+    else:
+        health.record_failure(elapsed, key)
+    return response
+
+
+def record_provider_result(provider, news_items):
+    """Track whether a provider call produced usable articles; returns the items or None"""
+    if not news_items:
+        PROVIDER_EMPTY_RESULTS.inc(provider=provider)
+    get_health(provider).record_result(not news_items)
+    return news_items or None
+
+
+def fetch_yfinance_info(symbol):
+    """ticker.info from Yahoo Finance, guarded by the yfinance circuit breaker"""
+    if not YFINANCE_ENABLED:
+        raise RuntimeError("yfinance disabled")
+    health = get_health('yfinance')
+    if not health.acquire():
+        raise CircuitOpenError("yfinance circuit open")
+    started = time.perf_counter()
+    try:
+        info = yf.Ticker(symbol).info
+    except Exception:
+        health.record_failure(time.perf_counter() - started)
+        raise
+    health.record_success(time.perf_counter() - started)
+    return info
 
 
 def get_company_name(symbol):
     """Get company name for a ticker symbol"""
-    try:
-        ticker = yf.Ticker(symbol)
-        return ticker.info.get('shortName') or ticker.info.get('longName') or symbol
-    except:
-        # Fallback to common names
-        common_names = {
-            'AAPL': 'Apple', 'TSLA': 'Tesla', 'GOOGL': 'Google', 'AMZN': 'Amazon',
-            'MSFT': 'Microsoft', 'NVDA': 'NVIDIA', 'META': 'Meta', 'NFLX': 'Netflix',
-            'AMD': 'AMD', 'INTC': 'Intel', 'WMT': 'Walmart', 'JPM': 'JPMorgan',
-            'V': 'Visa', 'MA': 'Mastercard', 'DIS': 'Disney', 'NKE': 'Nike',
-            'SBUX': 'Starbucks', 'PYPL': 'PayPal', 'UBER': 'Uber', 'SPOT': 'Spotify'
-        }
-        return common_names.get(symbol.upper(), symbol)
+    with span('company_name'):
+        try:
+            info = fetch_yfinance_info(symbol)
+            return info.get('shortName') or info.get('longName') or symbol
+        except:
+            # Fallback to common names
+            return COMMON_NAMES.get(symbol.upper(), symbol)
 
 # Fallback mock data when Yahoo Finance is rate limited
 FALLBACK_DATA = {
@@ -192,77 +314,130 @@ def get_news():
     cache_key = f"{symbol}_{time_filter}_{depth}"
     current_time = time.time()
     if cache_key in news_cache:
-        cached_data, cache_time = news_cache[cache_key]
+        cached_data, cached_body, cache_time = news_cache[cache_key]
         if current_time - cache_time < CACHE_DURATION:
-            print(f"Using cached news for {symbol} (depth={depth})")
-            return jsonify(cached_data), 200
-    
-    # Try multiple news APIs in order
-    news_items = None
-    
-    # 1. Try Finnhub API first (we have 2 keys)
-    if FINNHUB_API_KEY or FINNHUB_API_KEY_2:
-        news_items = fetch_finnhub_news(symbol, time_filter, depth)
-        if news_items:
-            news_cache[cache_key] = (news_items, current_time)
-            return jsonify(news_items), 200
-    
-    # 2. Try Alpha Vantage News API
-    news_items = fetch_alphavantage_news(symbol, time_filter, depth)
-    if news_items:
-        news_cache[cache_key] = (news_items, current_time)
-        return jsonify(news_items), 200
-    
-    # 3. Try NewsData.io
-    if NEWSDATA_API_KEY:
-        news_items = fetch_newsdata_news(symbol, time_filter, depth)
-        if news_items:
-            news_cache[cache_key] = (news_items, current_time)
-            return jsonify(news_items), 200
+            CACHE_REQUESTS.inc(cache='news', result='hit')
+            logger.debug("Using cached news for %s (depth=%s)", symbol, depth)
+            if attach_cached_scores(cached_data):
+                cached_body = CachedBody(cached_data.to_json().encode('utf-8'))
+                news_cache[cache_key] = (cached_data, cached_body, cache_time)
+            return batch_response(cached_data, cached_body)
+    CACHE_REQUESTS.inc(cache='news', result='miss')
     
-    # 4. Try NewsAPI
-    if newsapi:
-        news_items = fetch_newsapi_news(symbol, time_filter, depth)
-        if news_items:
-            news_cache[cache_key] = (news_items, current_time)
-            return jsonify(news_items), 200
-    
-    # 5. Try Polygon.io
-    if POLYGON_API_KEY:
-        news_items = fetch_polygon_news(symbol, time_filter, depth)
+    # Try configured news APIs, fastest healthy provider first; open circuits are skipped
+    news_sources = {
+        'finnhub': (bool(FINNHUB_API_KEY or FINNHUB_API_KEY_2), fetch_finnhub_news),
+        'alphavantage': (bool(ALPHA_VANTAGE_KEY), fetch_alphavantage_news),
+        'newsdata': (bool(NEWSDATA_API_KEY), fetch_newsdata_news),
+        'newsapi': (newsapi is not None, fetch_newsapi_news),
+        'polygon': (bool(POLYGON_API_KEY), fetch_polygon_news),
+    }
+    configured = [name for name, (enabled, _) in news_sources.items() if enabled]
+    for name in order_providers(configured):
+        news_items = news_sources[name][1](symbol, time_filter, depth)
         if news_items:
-            news_cache[cache_key] = (news_items, current_time)
-            return jsonify(news_items), 200
+            # Cached column-wise (records.py) with the serialized body, so hits skip encoding
+            batch = ArticleBatch.from_dicts(news_items)
+            attach_cached_scores(batch)
+            body = CachedBody(batch.to_json().encode('utf-8'))
+            news_cache[cache_key] = (batch, body, current_time)
+            return batch_response(batch, body)
     
     # Fallback to mock data
-    print(f"All news APIs failed for {symbol}, using mock data")
-    mock_news = get_mock_news(symbol)
-    news_cache[cache_key] = (mock_news, current_time)
-    return jsonify(mock_news), 200
+    logger.warning("All news APIs failed for %s, using mock data", symbol)
+    mock_news = ArticleBatch.from_dicts(get_mock_news(symbol))
+    body = CachedBody(mock_news.to_json().encode('utf-8'))
+    news_cache[cache_key] = (mock_news, body, current_time)
+    return batch_response(mock_news, body)
 
 
 @app.route('/api/sentiment/finbert', methods=['POST'])
 def analyze_with_finbert():
     """
     Analyze text sentiment using FinBERT model
-    Request body: { "texts": ["text1", "text2", ...] }
+    Request body: { "texts": ["text1", "text2", ...], "pooling": "mean"|"max"|"attention" }
+    Texts over 512 tokens are scored in chunks and pooled (default "mean").
+    Results are cached by text digest: texts already scored are not re-run, and
+    /api/news returns an article's score inline as `finbert` once its scoring text was scored.
     Returns: Array of sentiment results
     """
     if not FINBERT_AVAILABLE:
         return jsonify({"error": "FinBERT model not available"}), 503
     
-    data = request.get_json()
+    try:
+        data = request_json() or {}
+    except ValueError:
+        return jsonify({"error": "Invalid JSON body"}), 400
+    if not isinstance(data, dict):
+        return jsonify({"error": "JSON body must be an object"}), 400
     texts = data.get('texts', [])
+    pooling = data.get('pooling', 'mean')
     
     if not texts:
         return jsonify({"error": "No texts provided"}), 400
+    if not isinstance(texts, list):
+        return jsonify({"error": "texts must be a list of strings"}), 400
+    if pooling not in POOLING_METHODS:
+        return jsonify({"error": f"pooling must be one of {', '.join(POOLING_METHODS)}"}), 400
     
-    results = []
-    for text in texts:
-        sentiment = analyze_sentiment_finbert(text)
-        results.append(sentiment)
+    FINBERT_BATCH_SIZE.observe(len(texts))
+    scores = [None] * len(texts)
+    # Entries that are not strings (e.g. null) get a null result instead of failing the request
+    valid = [i for i, text in enumerate(texts) if isinstance(text, str)]
+    digests = {i: text_digest(texts[i]) for i in valid}
+    pending = []
+    for i in valid:
+        scores[i] = get_cached_score(digests[i], pooling)
+        if scores[i] is None:
+            pending.append(i)
+    CACHE_REQUESTS.inc(len(valid) - len(pending), cache='finbert', result='hit')
+    CACHE_REQUESTS.inc(len(pending), cache='finbert', result='miss')
+    
+    if pending:
+        # Model time only: cache hits and null entries would otherwise dilute the per-text figure
+        started = time.perf_counter()
+        scored = finbert_probabilities_batch([texts[i] for i in pending], pooling=pooling)
+        FINBERT_SECONDS_PER_TEXT.observe((time.perf_counter() - started) / len(pending))
+        for i, probabilities in zip(pending, scored):
+            scores[i] = probabilities
+            if probabilities is not None:
+                store_cached_score(digests[i], pooling, probabilities)
+    
+    results = ScoreBatch()
+    for probabilities in scores:
+        results.append(probabilities)
+    
+    return batch_response(results)
+
+
+@app.route('/api/sentiment/history', methods=['GET'])
+def sentiment_history():
+    """
+    Daily FinBERT sentiment from the backfill store (see backfill.py)
+    Query params: symbol, range (default '1y')
+    Returns: Array of {date, articles, positive, negative, neutral, score, counts}
+    """
+    symbol = request.args.get('symbol', '').strip().upper()
+    if not symbol:
+        return jsonify({"error": "Symbol parameter is required"}), 400
     
-    return jsonify(results), 200
+    since = (datetime.now() - timedelta(days=parse_time_filter(request.args.get('range', '1y')))).strftime('%Y-%m-%d')
+    try:
+        store = SentimentStore(readonly=True)
+    except sqlite3.OperationalError:
+        # Nothing backfilled yet
+        return jsonify([])
+    try:
+        with span('history_query'):
+            return jsonify(store.daily_sentiment(symbol, since))
+    finally:
+        store.close()
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics for this worker process"""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
 
 
 def get_ticker_info_alpha_vantage(symbol):
@@ -272,8 +447,8 @@ def get_ticker_info_alpha_vantage(symbol):
     
     try:
         # Alpha Vantage Global Quote endpoint
-        url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={ALPHA_VANTAGE_KEY}"
-        response = requests.get(url, timeout=10)
+        url = f"{ALPHA_VANTAGE_BASE_URL}/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={ALPHA_VANTAGE_KEY}"
+        response = provider_get('alphavantage', url)
         data = response.json()
         
         if 'Global Quote' in data and data['Global Quote']:
@@ -292,14 +467,14 @@ def get_ticker_info_alpha_vantage(symbol):
                 'change': round(change, 2)
             }
             
-            print(f"✓ Real-time data from Alpha Vantage: {symbol} = ${current_price}")
+            logger.info("Real-time data from Alpha Vantage: %s = $%s", symbol, current_price)
             return result
         else:
-            print(f"Alpha Vantage: No data for {symbol}")
+            logger.info("Alpha Vantage: No data for %s", symbol)
             return None
             
     except Exception as e:
-        print(f"Alpha Vantage error for {symbol}: {e}")
+        logger.warning("Alpha Vantage error for %s: %s", symbol, e)
         return None
 
 
@@ -321,61 +496,75 @@ def get_company_name_alpha_vantage(symbol):
     return names.get(symbol.upper(), symbol)
 
 
-def get_ticker_info(symbol):
-    """Get current price info for a single ticker with caching and real-time data"""
-    # Check cache first
-    current_time = time.time()
-    if symbol in ticker_cache:
-        cached_data, cache_time = ticker_cache[symbol]
-        if current_time - cache_time < CACHE_DURATION:
-            print(f"Using cached data for {symbol}")
-            return cached_data
-    
-    # Try Alpha Vantage first for REAL-TIME data
-    result = get_ticker_info_alpha_vantage(symbol)
-    
-    if result:
-        # Cache the result
-        ticker_cache[symbol] = (result, current_time)
-        return result
+def get_ticker_info_yfinance(symbol):
+    """Get stock data from Yahoo Finance via yfinance"""
+    if not YFINANCE_ENABLED or not get_health('yfinance').available():
+        return None
     
-    # Fallback to yfinance if Alpha Vantage fails
     try:
         time.sleep(0.2)
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = fetch_yfinance_info(symbol)
         
         current_price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
         previous_close = info.get('previousClose', current_price)
         change = current_price - previous_close if current_price else 0
         
         if current_price and current_price > 0:
-            result = {
+            logger.info("Using yfinance data for %s", symbol)
+            return {
                 'symbol': symbol,
                 'name': info.get('shortName', symbol),
                 'price': round(current_price, 2),
                 'change': round(change, 2)
             }
-            ticker_cache[symbol] = (result, current_time)
-            print(f"Using yfinance data for {symbol}")
-            return result
         
     except Exception as e:
-        print(f"yfinance error for {symbol}: {e}")
+        logger.warning("yfinance error for %s: %s", symbol, e)
+    return None
+
+
+def get_ticker_info(symbol):
+    """Get current price info for a single ticker with caching and real-time data"""
+    # Check cache first
+    current_time = time.time()
+    if symbol in ticker_cache:
+        cached_data, cache_time = ticker_cache[symbol]
+        if current_time - cache_time < CACHE_DURATION:
+            CACHE_REQUESTS.inc(cache='ticker', result='hit')
+            logger.debug("Using cached data for %s", symbol)
+            return cached_data
+    CACHE_REQUESTS.inc(cache='ticker', result='miss')
+    
+    # Alpha Vantage (real-time) and yfinance, healthiest first; open circuits are skipped
+    quote_sources = {
+        'alphavantage': get_ticker_info_alpha_vantage,
+        'yfinance': get_ticker_info_yfinance,
+    }
+    for name in order_providers(list(quote_sources)):
+        result = quote_sources[name](symbol)
+        if result:
+            # Cache the result
+            ticker_cache[symbol] = (result, current_time)
+            return result
     
     # Use fallback data as last resort
     if symbol in FALLBACK_DATA:
-        print(f"[WARNING] Using fallback mock data for {symbol} (API limits reached)")
+        logger.warning("Using fallback mock data for %s (API limits reached)", symbol)
         return FALLBACK_DATA[symbol]
     
     return None
 
 
+def finnhub_key_label(api_key):
+    """Metrics label for a Finnhub key (never the key itself)"""
+    return 'key2' if api_key == FINNHUB_API_KEY_2 and api_key != FINNHUB_API_KEY else 'key1'
+
+
 def get_finnhub_quote(symbol, api_key):
     """Get real-time quote from Finnhub"""
     try:
-        url = f"https://finnhub.io/api/v1/quote?symbol={symbol}&token={api_key}"
-        response = requests.get(url, timeout=5)
+        url = f"{FINNHUB_BASE_URL}/quote?symbol={symbol}&token={api_key}"
+        response = provider_get('finnhub', url, key=finnhub_key_label(api_key), timeout=5)
         if response.status_code == 200:
             data = response.json()
             current_price = data.get('c', 0)  # Current price
@@ -391,123 +580,140 @@ def get_finnhub_quote(symbol, api_key):
         return None
 
 
+def get_search_quote(entry):
+    """Price a local symbol index match: cached ticker data, then Finnhub quote, then get_ticker_info"""
+    symbol = entry['symbol']
+    cached = ticker_cache.get(symbol)
+    if cached and time.time() - cached[1] < CACHE_DURATION:
+        CACHE_REQUESTS.inc(cache='ticker', result='hit')
+        return {**cached[0], 'name': entry['name']}
+    
+    for api_key in (FINNHUB_API_KEY, FINNHUB_API_KEY_2):
+        if not api_key:
+            continue
+        quote_data = get_finnhub_quote(symbol, api_key)
+        if quote_data and quote_data['price'] > 0:
+            result = {'symbol': symbol, 'name': entry['name'], **quote_data}
+            ticker_cache[symbol] = (result, time.time())
+            return result
+    
+    ticker_data = get_ticker_info(symbol)
+    if ticker_data and ticker_data['price'] > 0:
+        return {**ticker_data, 'name': entry['name']}
+    return None
+
+
+def has_strong_match(matches, query):
+    """True if a symbol index match is the exact ticker or its company name starts with `query`"""
+    q = normalize_symbol_text(query)
+    return any(entry['symbol'].upper() == q or normalize_symbol_text(entry['name']).startswith(q)
+               for entry in matches)
+
+
 def search_yfinance_tickers(query):
     """
-    Search for tickers matching the query using Finnhub Symbol Search API
-    Supports worldwide company search across all exchanges
-    Gets price data directly from Finnhub to avoid Yahoo Finance rate limits
+    Search for tickers matching the query
+    Matches come from the local symbol index first; a full page with a ticker or
+    company-name match is answered without a remote search. Otherwise Finnhub
+    Symbol Search (worldwide, all exchanges) fills in symbols not in the local list.
     """
     results = []
+    weak = []
     query_upper = query.upper().strip()
     
     if not query_upper:
         return results
     
-    # Try Finnhub symbol search first (supports worldwide search)
-    if FINNHUB_API_KEY:
+    # Local prefix/fuzzy index first - answers without a network round trip
+    with span('symbol_index'):
+        # Only as many matches as the page shows: each one may cost a Finnhub quote call
+        matches = SYMBOL_INDEX.search(query_upper, limit=5)
+    if matches:
+        with span('search_quotes'):
+            quotes = list(search_quote_executor.map(get_search_quote, matches))
+        results = [quote for quote in quotes if quote]
+        # Only a full page with a ticker or company-name match is final; fuzzy and word
+        # matches (e.g. 'F' -> META via "Facebook") must not hide symbols the local list lacks
+        strong = has_strong_match(matches, query_upper)
+        if strong and len(results) >= 5:
+            logger.info("Symbol index: %d results for '%s'", len(results), query)
+            return results
+        if not strong:
+            # Weak local matches rank after whatever the remote search finds
+            weak, results = results, []
+    found = {result['symbol'] for result in results}
+    results.extend(search_remote_tickers(query, query_upper, found, limit=5 - len(results)))
+    results.extend(result for result in weak if result['symbol'] not in found)
+    # The exact ticker leads even when only the remote search knew it ('T' -> AT&T before Tesla)
+    results.sort(key=lambda result: result['symbol'].upper() != query_upper)
+    return results[:5]
+
+
+def search_remote_tickers(query, query_upper, found, limit=5):
+    """Finnhub symbol search, then a direct ticker lookup; skips symbols in `found` (and adds to it)"""
+    results = []
+    
+    # Not (fully) answered by the local list: Finnhub symbol search (supports worldwide search)
+    # Keys have separate rate limits and circuits: a 429 or open circuit moves on to the next key
+    for api_key, key_label in ((FINNHUB_API_KEY, 'key1'), (FINNHUB_API_KEY_2, 'key2')):
+        if not api_key:
+            continue
         try:
             # Finnhub symbol search endpoint
-            url = f"https://finnhub.io/api/v1/search?q={query_upper}&token={FINNHUB_API_KEY}"
-            response = requests.get(url, timeout=10)
+            url = f"{FINNHUB_BASE_URL}/search?q={query_upper}&token={api_key}"
+            response = provider_get('finnhub', url, key=key_label)
+            if response.status_code == 429:
+                logger.warning("Finnhub %s rate limited, trying next key...", key_label)
+                continue
+            if response.status_code != 200:
+                break
             
-            if response.status_code == 200:
-                data = response.json()
-                symbols = data.get('result', [])
+            symbols = response.json().get('result', [])
+            # Process up to 10 results to find 5 valid ones
+            for item in symbols[:10]:
+                symbol = item.get('symbol', '')
+                description = item.get('description', '')
+                ticker_type = item.get('type', '')
                 
-                # Process up to 10 results to find 5 valid ones
-                for item in symbols[:10]:
-                    symbol = item.get('symbol', '')
-                    description = item.get('description', '')
-                    ticker_type = item.get('type', '')
-                    display_symbol = item.get('displaySymbol', symbol)
-                    
-                    # Skip invalid or non-stock entries
-                    if not symbol or ticker_type in ['warrant', 'right', 'index']:
-                        continue
-                    
-                    # Get price data directly from Finnhub (faster, no Yahoo rate limits)
-                    quote_data = get_finnhub_quote(symbol, FINNHUB_API_KEY)
-                    
-                    if quote_data and quote_data['price'] > 0:
-                        ticker_data = {
-                            'symbol': symbol,
-                            'name': description or symbol,
-                            'price': quote_data['price'],
-                            'change': quote_data['change']
-                        }
-                        results.append(ticker_data)
-                        
-                    # Limit to 5 valid results
-                    if len(results) >= 5:
-                        break
+                # Skip invalid or non-stock entries, and symbols the local index already returned
+                if not symbol or ticker_type in ['warrant', 'right', 'index'] or symbol in found:
+                    continue
+                
+                # Get price data directly from Finnhub (faster, no Yahoo rate limits)
+                quote_data = get_finnhub_quote(symbol, api_key)
                 
-                if results:
-                    print(f"[OK] Finnhub search: {len(results)} results for '{query}'")
-                    return results
-            elif response.status_code == 429:
-                print("[WARNING] Finnhub API rate limit reached, trying fallback key...")
-                # Try second Finnhub key
-                if FINNHUB_API_KEY_2:
-                    url = f"https://finnhub.io/api/v1/search?q={query_upper}&token={FINNHUB_API_KEY_2}"
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        symbols = data.get('result', [])
-                        for item in symbols[:10]:
-                            symbol = item.get('symbol', '')
-                            description = item.get('description', '')
-                            ticker_type = item.get('type', '')
-                            if not symbol or ticker_type in ['warrant', 'right', 'index']:
-                                continue
-                            quote_data = get_finnhub_quote(symbol, FINNHUB_API_KEY_2)
-                            if quote_data and quote_data['price'] > 0:
-                                ticker_data = {
-                                    'symbol': symbol,
-                                    'name': description or symbol,
-                                    'price': quote_data['price'],
-                                    'change': quote_data['change']
-                                }
-                                results.append(ticker_data)
-                            if len(results) >= 5:
-                                break
-                        if results:
-                            print(f"[OK] Finnhub key 2: {len(results)} results for '{query}'")
-                            return results
+                if quote_data and quote_data['price'] > 0:
+                    ticker_data = {
+                        'symbol': symbol,
+                        'name': description or symbol,
+                        'price': quote_data['price'],
+                        'change': quote_data['change']
+                    }
+                    results.append(ticker_data)
+                    found.add(symbol)
+                    
+                # Limit to the slots the local index left
+                if len(results) >= limit:
+                    break
+            
+            if results:
+                logger.info("Finnhub search (%s): %d results for '%s'", key_label, len(results), query)
+                return results
+            break
         except Exception as e:
-            print(f"[WARNING] Finnhub search failed: {str(e)}")
+            logger.warning("Finnhub search with %s failed: %s", key_label, e)
     
     # Fallback: Try direct ticker lookup with cached yfinance
-    if len(query_upper) <= 5:  # Ticker symbols are usually 1-5 characters
+    if len(query_upper) <= 5 and query_upper not in found:  # Ticker symbols are usually 1-5 characters
         try:
             ticker_data = get_ticker_info(query_upper)
             if ticker_data and ticker_data['price'] > 0:
                 results.append(ticker_data)
-                print(f"[OK] Direct ticker lookup successful: {query_upper}")
+                found.add(query_upper)
+                logger.info("Direct ticker lookup successful: %s", query_upper)
                 return results
         except Exception as e:
-            print(f"[WARNING] Direct ticker lookup failed for {query_upper}: {str(e)}")
-    
-    # Fallback: Common ticker mappings for popular searches
-    popular_mapping = {
-        'APPLE': 'AAPL', 'TESLA': 'TSLA', 'GOOGLE': 'GOOGL',
-        'AMAZON': 'AMZN', 'MICROSOFT': 'MSFT', 'NVIDIA': 'NVDA',
-        'META': 'META', 'FACEBOOK': 'META', 'NETFLIX': 'NFLX',
-        'AMD': 'AMD', 'INTEL': 'INTC', 'WALMART': 'WMT',
-        'JPMORGAN': 'JPM', 'VISA': 'V', 'MASTERCARD': 'MA',
-        'DISNEY': 'DIS', 'NIKE': 'NKE', 'STARBUCKS': 'SBUX',
-        'PAYPAL': 'PYPL', 'UBER': 'UBER', 'SPOTIFY': 'SPOT',
-    }
-    
-    for name, symbol in popular_mapping.items():
-        if query_upper in name or name.startswith(query_upper):
-            ticker_data = get_ticker_info(symbol)
-            if ticker_data and ticker_data['price'] > 0:
-                results.append(ticker_data)
-            if len(results) >= 5:
-                break
-    
-    if results:
-        print(f"[OK] Fallback mapping: {len(results)} results for '{query}'")
+            logger.warning("Direct ticker lookup failed for %s: %s", query_upper, e)
     
     return results
 
@@ -538,42 +744,10 @@ def get_article_limit(depth):
     return limits.get(depth, 40)  # Default to standard
 
 
-def analyze_sentiment_finbert(text):
-    """
-    Analyze sentiment using FinBERT model
-    Returns: {'sentiment': 'positive'|'negative'|'neutral', 'score': float, 'scores': {}}
-    """
-    if not FINBERT_AVAILABLE:
-        return None
-    
-    try:
-        # Tokenize and get model output
-        inputs = finbert_tokenizer(text, return_tensors="pt", truncation=True, max_length=512, padding=True)
-        
-        with torch.no_grad():
-            outputs = finbert_model(**inputs)
-            predictions = F.softmax(outputs.logits, dim=-1)
-        
-        # FinBERT outputs: [positive, negative, neutral]
-        scores = predictions[0].tolist()
-        sentiment_map = {0: 'positive', 1: 'negative', 2: 'neutral'}
-        
-        predicted_class = torch.argmax(predictions, dim=1).item()
-        sentiment = sentiment_map[predicted_class]
-        confidence = scores[predicted_class]
-        
-        return {
-            'sentiment': sentiment,
-            'confidence': round(confidence, 4),
-            'scores': {
-                'positive': round(scores[0], 4),
-                'negative': round(scores[1], 4),
-                'neutral': round(scores[2], 4)
-            }
-        }
-    except Exception as e:
-        print(f"FinBERT analysis error: {e}")
-        return None
+def filter_relevant(articles, symbol, company_name):
+    """Keep only articles relevant to the company (timed as the relevance_filter stage)"""
+    with span('relevance_filter'):
+        return [article for article in articles if is_relevant_news(article, symbol, company_name)]
 
 
 def fetch_alphavantage_news(symbol, time_filter, depth='standard'):
@@ -586,30 +760,30 @@ def fetch_alphavantage_news(symbol, time_filter, depth='standard'):
         company_name = get_company_name(symbol)
         article_limit = get_article_limit(depth)
         
-        url = f"https://www.alphavantage.co/query?function=NEWS_SENTIMENT&tickers={symbol}&apikey={ALPHA_VANTAGE_KEY}&limit={article_limit}"
-        response = requests.get(url, timeout=10)
+        url = f"{ALPHA_VANTAGE_BASE_URL}/query?function=NEWS_SENTIMENT&tickers={symbol}&apikey={ALPHA_VANTAGE_KEY}&limit={article_limit}"
+        response = provider_get('alphavantage', url)
         data = response.json()
         
         if 'feed' in data and data['feed']:
-            news_items = []
-            for idx, article in enumerate(data['feed'][:article_limit]):
-                article_data = {
-                    'id': f"{symbol}_av_{idx}",
+            candidates = []
+            for article in data['feed'][:article_limit]:
+                candidates.append({
+                    'id': article_id(article.get('url', ''), article.get('title', '')),
                     'title': article.get('title', ''),
                     'source': article.get('source', 'Alpha Vantage'),
                     'publishedAt': article.get('time_published', ''),
                     'url': article.get('url', ''),
-                    'summary': article.get('summary', '')[:500]
-                }
-                
-                # Only include if relevant to the company
-                if is_relevant_news(article_data, symbol, company_name):
-                    news_items.append(article_data)
-                    
-            print(f"[OK] Alpha Vantage News: {len(news_items)} relevant articles for {symbol} (filtered from {len(data['feed'])})")
-            return news_items if news_items else None
+                    'summary': article.get('summary', '')[:SUMMARY_MAX_CHARS or None]
+                })
+            
+            # Only include if relevant to the company
+            news_items = filter_relevant(candidates, symbol, company_name)
+            logger.info("Alpha Vantage News: %d relevant articles for %s (filtered from %d)",
+                        len(news_items), symbol, len(data['feed']))
+            return record_provider_result('alphavantage', news_items)
+        record_provider_result('alphavantage', None)
     except Exception as e:
-        print(f"Alpha Vantage News error: {e}")
+        logger.warning("Alpha Vantage News error: %s", e)
     return None
 
 
@@ -630,36 +804,36 @@ def fetch_finnhub_news(symbol, time_filter, depth='standard'):
             from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
             to_date = datetime.now().strftime('%Y-%m-%d')
             
-            url = f"https://finnhub.io/api/v1/company-news?symbol={symbol}&from={from_date}&to={to_date}&token={key}"
-            response = requests.get(url, timeout=10)
+            url = f"{FINNHUB_BASE_URL}/company-news?symbol={symbol}&from={from_date}&to={to_date}&token={key}"
+            response = provider_get('finnhub', url, key=f"key{idx + 1}")
             
             if response.status_code == 429:
-                print(f"Finnhub key {idx + 1} rate limited, trying next...")
+                logger.warning("Finnhub key %d rate limited, trying next...", idx + 1)
                 continue
                 
             data = response.json()
             
             if isinstance(data, list) and data:
-                news_items = []
+                candidates = []
                 total_fetched = len(data[:article_limit])
-                for article_idx, article in enumerate(data[:article_limit]):
-                    article_data = {
-                        'id': f"{symbol}_fh_{article_idx}",
+                for article in data[:article_limit]:
+                    candidates.append({
+                        'id': article_id(article.get('url', ''), article.get('headline', '')),
                         'title': article.get('headline', ''),
                         'source': article.get('source', 'Finnhub'),
                         'publishedAt': datetime.fromtimestamp(article.get('datetime', 0)).isoformat(),
                         'url': article.get('url', ''),
-                        'summary': article.get('summary', '')[:500]
-                    }
-                    
-                    # Only include if relevant to the company
-                    if is_relevant_news(article_data, symbol, company_name):
-                        news_items.append(article_data)
-                        
-                print(f"[OK] Finnhub key {idx + 1}: {len(news_items)} relevant articles for {symbol} (filtered from {total_fetched})")
-                return news_items if news_items else None
+                        'summary': article.get('summary', '')[:SUMMARY_MAX_CHARS or None]
+                    })
+                
+                # Only include if relevant to the company
+                news_items = filter_relevant(candidates, symbol, company_name)
+                logger.info("Finnhub key %d: %d relevant articles for %s (filtered from %d)",
+                            idx + 1, len(news_items), symbol, total_fetched)
+                return record_provider_result('finnhub', news_items)
+            record_provider_result('finnhub', None)
         except Exception as e:
-            print(f"Finnhub key {idx + 1} error: {e}")
+            logger.warning("Finnhub key %d error: %s", idx + 1, e)
             continue
     
     return None
@@ -678,35 +852,54 @@ def fetch_newsapi_news(symbol, time_filter, depth='standard'):
         # Get company name
         company_name = get_company_name(symbol)
         
-        articles = newsapi.get_everything(
-            q=f"{symbol} OR {company_name}",
-            from_param=from_date,
-            language='en',
-            sort_by='publishedAt',
-            page_size=article_limit
-        )
+        # NewsAPI goes through its client library, so record provider metrics and health here
+        health = get_health('newsapi')
+        if not health.acquire():
+            PROVIDER_REQUESTS.inc(provider='newsapi', key='key1', outcome='circuit_open')
+            raise CircuitOpenError("newsapi circuit open")
+        started = time.perf_counter()
+        try:
+            articles = newsapi.get_everything(
+                q=f"{symbol} OR {company_name}",
+                from_param=from_date,
+                language='en',
+                sort_by='publishedAt',
+                page_size=article_limit
+            )
+            outcome = 'ok'
+        except Exception as e:
+            outcome = 'rate_limited' if 'rateLimited' in str(e) else 'exception'
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            PROVIDER_REQUEST_SECONDS.observe(elapsed, provider='newsapi', key='key1')
+            PROVIDER_REQUESTS.inc(provider='newsapi', key='key1', outcome=outcome)
+            trace_stage('provider:newsapi', elapsed)
+            if outcome == 'ok':
+                health.record_success(elapsed)
+            else:
+                health.record_failure(elapsed)
         
-        news_items = []
+        candidates = []
         total_fetched = len(articles.get('articles', []))
-        for idx, article in enumerate(articles.get('articles', [])):
-            article_data = {
-                'id': f"{symbol}_na_{idx}",
+        for article in articles.get('articles', []):
+            candidates.append({
+                'id': article_id(article['url'], article['title']),
                 'title': article['title'],
                 'source': article['source']['name'],
                 'publishedAt': article['publishedAt'],
                 'url': article['url'],
-                'summary': article.get('description', article['title'])[:500]
-            }
-            
-            # Only include if relevant to the company
-            if is_relevant_news(article_data, symbol, company_name):
-                news_items.append(article_data)
+                'summary': article.get('description', article['title'])[:SUMMARY_MAX_CHARS or None]
+            })
         
+        # Only include if relevant to the company
+        news_items = filter_relevant(candidates, symbol, company_name)
         if news_items:
-            print(f"[OK] NewsAPI: {len(news_items)} relevant articles for {symbol} (filtered from {total_fetched})")
-            return news_items
+            logger.info("NewsAPI: %d relevant articles for %s (filtered from %d)",
+                        len(news_items), symbol, total_fetched)
+        return record_provider_result('newsapi', news_items)
     except Exception as e:
-        print(f"NewsAPI error: {e}")
+        logger.warning("NewsAPI error: %s", e)
     return None
 
 
@@ -717,25 +910,26 @@ def fetch_polygon_news(symbol, time_filter, depth='standard'):
     
     try:
         article_limit = get_article_limit(depth)
-        url = f"https://api.polygon.io/v2/reference/news?ticker={symbol}&limit={article_limit}&apiKey={POLYGON_API_KEY}"
-        response = requests.get(url, timeout=10)
+        url = f"{POLYGON_BASE_URL}/v2/reference/news?ticker={symbol}&limit={article_limit}&apiKey={POLYGON_API_KEY}"
+        response = provider_get('polygon', url)
         data = response.json()
         
         if 'results' in data and data['results']:
             news_items = []
-            for idx, article in enumerate(data['results']):
+            for article in data['results']:
                 news_items.append({
-                    'id': f"{symbol}_pg_{idx}",
+                    'id': article_id(article.get('article_url', ''), article.get('title', '')),
                     'title': article.get('title', ''),
                     'source': article.get('publisher', {}).get('name', 'Polygon'),
                     'publishedAt': article.get('published_utc', ''),
                     'url': article.get('article_url', ''),
-                    'summary': article.get('description', '')[:500]
+                    'summary': article.get('description', '')[:SUMMARY_MAX_CHARS or None]
                 })
-            print(f"✓ Polygon: {len(news_items)} articles for {symbol}")
-            return news_items
+            logger.info("Polygon: %d articles for %s", len(news_items), symbol)
+            return record_provider_result('polygon', news_items)
+        record_provider_result('polygon', None)
     except Exception as e:
-        print(f"Polygon error: {e}")
+        logger.warning("Polygon error: %s", e)
     return None
 
 
@@ -749,31 +943,31 @@ def fetch_newsdata_news(symbol, time_filter, depth='standard'):
         company_name = get_company_name(symbol)
         article_limit = get_article_limit(depth)
         
-        url = f"https://newsdata.io/api/1/news?apikey={NEWSDATA_API_KEY}&q={symbol}&language=en"
-        response = requests.get(url, timeout=10)
+        url = f"{NEWSDATA_BASE_URL}/news?apikey={NEWSDATA_API_KEY}&q={symbol}&language=en"
+        response = provider_get('newsdata', url)
         data = response.json()
         
         if 'results' in data and data['results']:
-            news_items = []
+            candidates = []
             total_fetched = len(data['results'][:article_limit])
-            for idx, article in enumerate(data['results'][:article_limit]):
-                article_data = {
-                    'id': f"{symbol}_nd_{idx}",
+            for article in data['results'][:article_limit]:
+                candidates.append({
+                    'id': article_id(article.get('link', ''), article.get('title', '')),
                     'title': article.get('title', ''),
                     'source': article.get('source_id', 'NewsData'),
                     'publishedAt': article.get('pubDate', ''),
                     'url': article.get('link', ''),
-                    'summary': article.get('description', '')[:500]
-                }
-                
-                # Only include if relevant to the company
-                if is_relevant_news(article_data, symbol, company_name):
-                    news_items.append(article_data)
-                    
-            print(f"[OK] NewsData: {len(news_items)} relevant articles for {symbol} (filtered from {total_fetched})")
-            return news_items if news_items else None
+                    'summary': article.get('description', '')[:SUMMARY_MAX_CHARS or None]
+                })
+            
+            # Only include if relevant to the company
+            news_items = filter_relevant(candidates, symbol, company_name)
+            logger.info("NewsData: %d relevant articles for %s (filtered from %d)",
+                        len(news_items), symbol, total_fetched)
+            return record_provider_result('newsdata', news_items)
+        record_provider_result('newsdata', None)
     except Exception as e:
-        print(f"NewsData error: {e}")
+        logger.warning("NewsData error: %s", e)
     return None
 
 
@@ -901,13 +1095,14 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'ok',
-        'newsApiConfigured': newsapi is not None
+        'newsApiConfigured': newsapi is not None,
+        'providers': health_snapshot()
     })
 
 
 if __name__ == '__main__':
-    print("Starting Sentify Backend Server...")
-    print("Market data powered by yfinance")
-    print(f"News API: {'Configured' if newsapi else 'Not configured'}")
-    print("Server running on http://localhost:5000")
+    logger.info("Starting Sentify Backend Server...")
+    logger.info("Market data powered by yfinance")
+    logger.info("News API: %s", 'Configured' if newsapi else 'Not configured')
+    logger.info("Server running on http://localhost:5000")
     app.run(debug=True, port=5000)
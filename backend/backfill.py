@@ -0,0 +1,357 @@
+"""
+Sentify Backend - Historical Backfill
+Offline job that pages through provider news history for a list of symbols,
+scores every article with batched FinBERT in a process pool and writes the
+results to the sentiment store (sentiment_store.py), which long-range views
+read instead of fetching years of news inside one HTTP request.
+
+Progress is checkpointed per symbol/provider after every stored page, so an
+interrupted run picks up where it stopped when started again with the same
+arguments. Requests are spaced to stay inside each provider's rate budget.
+
+Usage:
+    python backfill.py AAPL MSFT --range 3y
+    python backfill.py --symbols-file symbols.txt --providers finnhub,polygon --workers 2
+"""
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+import requests
+
+from chunking import POOLING_METHODS
+from records import article_id, scoring_text
+from relevance import COMMON_NAMES, is_relevant_news
+from sentiment_store import SentimentStore, store_path
+
+logger = logging.getLogger('sentify.backfill')
+
+# Long ranges offered by parse_time_filter in app.py
+RANGE_DAYS = {'1y': 365, '3y': 1095, '5y': 1825}
+
+# Requests per minute, below the free-tier limits; override with --rate provider=N
+DEFAULT_RATES = {'finnhub': 50, 'alphavantage': 5, 'polygon': 5}
+# Requests per run for providers with a daily quota
+DEFAULT_DAILY_LIMITS = {'alphavantage': 25}
+# Days per request for providers paged by date window
+DEFAULT_WINDOW_DAYS = {'finnhub': 7, 'alphavantage': 30}
+
+
+class BudgetExhausted(Exception):
+    """A provider's request budget for this run is used up"""
+
+
+class RateBudget:
+    """Spaces calls to stay under `per_minute`, with an optional cap on calls per run"""
+
+    def __init__(self, per_minute, limit=None):
+        self.interval = 60.0 / per_minute
+        self.limit = limit
+        self.used = 0
+        self.next_at = 0.0
+
+    def wait(self):
+        if self.limit is not None and self.used >= self.limit:
+            raise BudgetExhausted(f"{self.used} requests used")
+        delay = self.next_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_at = time.monotonic() + self.interval
+        self.used += 1
+
+
+def provider_json(budget, url, params, retries=3):
+    """GET `url` within `budget`, backing off on 429"""
+    for attempt in range(retries + 1):
+        budget.wait()
+        response = requests.get(url, params=params, timeout=30)
+        if response.status_code == 429 and attempt < retries:
+            backoff = 30 * (attempt + 1)
+            logger.warning("Rate limited by %s, retrying in %ds", url, backoff)
+            time.sleep(backoff)
+            continue
+        response.raise_for_status()
+        return response.json()
+
+
+def make_article(title, source, published_at, url, summary):
+    return {
+        'id': article_id(url, title),
+        'title': title or '',
+        'source': source,
+        'publishedAt': published_at,
+        'url': url or '',
+        'summary': summary or '',
+    }
+
+
+def date_windows(start, end, window_days, cursor):
+    """
+    (window_start, window_end) pairs walking back from `cursor` (or the day after
+    `end`) to `start`; window_end is exclusive
+    """
+    window_end = date.fromisoformat(cursor) if cursor else end + timedelta(days=1)
+    while window_end > start:
+        window_start = max(start, window_end - timedelta(days=window_days))
+        yield window_start, window_end
+        window_end = window_start
+
+
+def finnhub_pages(symbol, start, end, checkpoint, budget, window_days):
+    """Yields (articles, cursor, done); the cursor is the oldest date already covered"""
+    base_url = os.getenv('FINNHUB_BASE_URL', 'https://finnhub.io/api/v1')
+    api_key = os.getenv('FINNHUB_API_KEY') or os.getenv('FINNHUB_API_KEY_2')
+    for window_start, window_end in date_windows(start, end, window_days, checkpoint and checkpoint['cursor']):
+        data = provider_json(budget, f"{base_url}/company-news", {
+            'symbol': symbol,
+            'from': window_start.isoformat(),
+            'to': (window_end - timedelta(days=1)).isoformat(),
+            'token': api_key,
+        })
+        articles = [make_article(
+            item.get('headline'), item.get('source', 'Finnhub'),
+            datetime.fromtimestamp(item.get('datetime', 0), timezone.utc).strftime('%Y-%m-%dT%H:%M:%S'),
+            item.get('url'), item.get('summary'),
+        ) for item in (data if isinstance(data, list) else [])]
+        yield articles, window_start.isoformat(), window_start <= start
+
+
+def alphavantage_pages(symbol, start, end, checkpoint, budget, window_days):
+    """Yields (articles, cursor, done); the cursor is the oldest date already covered"""
+    base_url = os.getenv('ALPHA_VANTAGE_BASE_URL', 'https://www.alphavantage.co')
+    for window_start, window_end in date_windows(start, end, window_days, checkpoint and checkpoint['cursor']):
+        data = provider_json(budget, f"{base_url}/query", {
+            'function': 'NEWS_SENTIMENT',
+            'tickers': symbol,
+            'time_from': window_start.strftime('%Y%m%dT0000'),
+            'time_to': window_end.strftime('%Y%m%dT0000'),
+            'sort': 'LATEST',
+            'limit': 1000,
+            'apikey': os.getenv('ALPHA_VANTAGE_KEY'),
+        })
+        if 'feed' not in data and ('Note' in data or 'Information' in data):
+            # Alpha Vantage reports quota exhaustion in a 200 response
+            raise BudgetExhausted(data.get('Note') or data.get('Information'))
+        articles = []
+        for item in data.get('feed', []):
+            published = item.get('time_published', '')
+            try:
+                published = datetime.strptime(published, '%Y%m%dT%H%M%S').strftime('%Y-%m-%dT%H:%M:%S')
+            except ValueError:
+                pass
+            articles.append(make_article(item.get('title'), item.get('source', 'Alpha Vantage'), published,
+                                         item.get('url'), item.get('summary')))
+        yield articles, window_start.isoformat(), window_start <= start
+
+
+def polygon_pages(symbol, start, end, checkpoint, budget, window_days):
+    """Yields (articles, cursor, done); the cursor is Polygon's next_url"""
+    if checkpoint and checkpoint['done']:
+        return
+    base_url = os.getenv('POLYGON_BASE_URL', 'https://api.polygon.io')
+    api_key = os.getenv('POLYGON_API_KEY')
+    url = checkpoint and checkpoint['cursor']
+    params = {'apiKey': api_key}
+    if not url:
+        url = f"{base_url}/v2/reference/news"
+        params.update({
+            'ticker': symbol,
+            'published_utc.gte': start.isoformat(),
+            'published_utc.lt': (end + timedelta(days=1)).isoformat(),
+            'order': 'desc',
+            'sort': 'published_utc',
+            'limit': 1000,
+        })
+    while url:
+        data = provider_json(budget, url, params)
+        articles = [make_article(
+            item.get('title'), item.get('publisher', {}).get('name', 'Polygon'),
+            item.get('published_utc', '')[:19], item.get('article_url'), item.get('description'),
+        ) for item in data.get('results', [])]
+        # next_url carries the query but not the key
+        url = data.get('next_url')
+        params = {'apiKey': api_key}
+        yield articles, url, not url
+
+
+PAGERS = {
+    'finnhub': finnhub_pages,
+    'alphavantage': alphavantage_pages,
+    'polygon': polygon_pages,
+}
+
+
+def configured_providers():
+    keys = {
+        'finnhub': os.getenv('FINNHUB_API_KEY') or os.getenv('FINNHUB_API_KEY_2'),
+        'alphavantage': os.getenv('ALPHA_VANTAGE_KEY'),
+        'polygon': os.getenv('POLYGON_API_KEY'),
+    }
+    return [name for name in PAGERS if keys[name]]
+
+
+def company_names(symbols):
+    """Company names for the relevance filter: the short common names, then the local symbol list"""
+    from symbol_index import load_symbol_index
+
+    index = load_symbol_index(os.getenv('SYMBOL_LIST_PATH'))
+    listed = {entry['symbol'].upper(): entry['name'] for entry in index.entries}
+    return {symbol: COMMON_NAMES.get(symbol) or listed.get(symbol) or symbol for symbol in symbols}
+
+
+# Scoring runs in worker processes, each with its own FinBERT copy
+_finbert = None
+
+
+def _init_worker(torch_threads):
+    global _finbert
+    # Imported here so only the workers load torch and the model
+    import finbert
+
+    if finbert.load_model(torch_threads):
+        _finbert = finbert
+
+
+def _score_texts(texts, batch_size, pooling):
+    if _finbert is None:
+        raise RuntimeError("FinBERT model not available in worker")
+    return _finbert.finbert_probabilities_batch(texts, batch_size, pooling)
+
+
+def _commit_page(store, symbol, provider, page):
+    articles, futures, cursor, done = page
+    scores = [score for future in futures for score in future.result()]
+    if any(score is None for score in scores):
+        # Stop before the checkpoint moves past unscored articles
+        raise RuntimeError(f"FinBERT scoring failed for {symbol}/{provider}")
+    store.save_page(symbol, provider, articles, scores, cursor, done)
+    logger.info("%s/%s: stored %d articles%s", symbol, provider, len(articles), " (complete)" if done else "")
+
+
+def backfill(symbols, providers, start, end, store, pool, batch_size=32, max_inflight=4,
+             rates=None, window_days=None, pooling='mean', names=None):
+    """
+    Page, score and store history for every symbol/provider pair, resuming from checkpoints.
+    Articles go through the same relevance filter as /api/news, using `names`
+    (symbol -> company name) where given.
+    """
+    names = names or {}
+    rates = {**DEFAULT_RATES, **(rates or {})}
+    budgets = {name: RateBudget(rates[name], DEFAULT_DAILY_LIMITS.get(name)) for name in providers}
+    exhausted = set()
+
+    for symbol in symbols:
+        seen = set()
+        for provider in providers:
+            if provider in exhausted:
+                continue
+            checkpoint = store.checkpoint(symbol, provider)
+            pages = PAGERS[provider](symbol, start, end, checkpoint, budgets[provider],
+                                     window_days or DEFAULT_WINDOW_DAYS.get(provider))
+            # Pages whose scores are still being computed; stored strictly in order
+            inflight = deque()
+            try:
+                for articles, cursor, done in pages:
+                    unique = {}
+                    for article in articles:
+                        if article['id'] not in seen and is_relevant_news(article, symbol, names.get(symbol)):
+                            unique[article['id']] = article
+                    known = store.known_ids(symbol, unique)
+                    fresh = [article for article_id, article in unique.items() if article_id not in known]
+                    seen.update(unique)
+                    texts = [scoring_text(article['title'], article['summary']) for article in fresh]
+                    futures = [pool.submit(_score_texts, texts[i:i + batch_size], batch_size, pooling)
+                               for i in range(0, len(texts), batch_size)]
+                    inflight.append((fresh, futures, cursor, done))
+                    while len(inflight) > max_inflight:
+                        _commit_page(store, symbol, provider, inflight.popleft())
+            except BudgetExhausted as e:
+                logger.warning("%s budget exhausted (%s); rerun later to continue", provider, e)
+                exhausted.add(provider)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning("%s/%s stopped: %s; rerun to resume", symbol, provider, e)
+            except (KeyboardInterrupt, RuntimeError):
+                # Scoring failed or the run was interrupted: leave pending pages to the next run
+                inflight.clear()
+                raise
+            finally:
+                while inflight:
+                    _commit_page(store, symbol, provider, inflight.popleft())
+
+
+def main():
+    from dotenv import load_dotenv
+    from logging_setup import configure_logging
+
+    load_dotenv()
+    configure_logging()
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Backfill scored news history into the sentiment store")
+    parser.add_argument('symbols', nargs='*', help="Ticker symbols")
+    parser.add_argument('--symbols-file', help="File with one symbol per line")
+    parser.add_argument('--range', choices=sorted(RANGE_DAYS), default='1y', help="How far back to go")
+    parser.add_argument('--since', help="Start date (YYYY-MM-DD), overrides --range")
+    parser.add_argument('--providers', help=f"Comma-separated subset of {','.join(PAGERS)} (default: all configured)")
+    parser.add_argument('--workers', type=int, default=max(1, cpus // 2), help="Scoring processes")
+    parser.add_argument('--torch-threads', type=int, default=0, help="Torch threads per worker (default cpus/workers)")
+    parser.add_argument('--batch-size', type=int, default=32, help="Texts per FinBERT forward pass")
+    parser.add_argument('--pooling', choices=POOLING_METHODS, default='mean',
+                        help="How chunk scores of long texts are combined")
+    parser.add_argument('--max-inflight', type=int, default=4, help="Pages being scored ahead of the store")
+    parser.add_argument('--window-days', type=int, help="Days per request for date-paged providers")
+    parser.add_argument('--rate', action='append', default=[], metavar='PROVIDER=N',
+                        help="Requests per minute for a provider")
+    parser.add_argument('--store', default=store_path(), help="SQLite file (SENTIMENT_STORE_PATH)")
+    parser.add_argument('--restart', action='store_true',
+                        help="Ignore checkpoints for these symbols (already stored articles are not re-scored)")
+    args = parser.parse_args()
+
+    symbols = [s.upper() for s in args.symbols]
+    if args.symbols_file:
+        with open(args.symbols_file) as f:
+            symbols += [line.strip().upper() for line in f if line.strip() and not line.startswith('#')]
+    if not symbols:
+        parser.error("no symbols given")
+
+    providers = args.providers.split(',') if args.providers else configured_providers()
+    unknown = [name for name in providers if name not in PAGERS]
+    if unknown:
+        parser.error(f"unknown providers: {', '.join(unknown)}")
+    if not providers:
+        parser.error("no provider API keys configured (FINNHUB_API_KEY, ALPHA_VANTAGE_KEY, POLYGON_API_KEY)")
+
+    rates = {}
+    for item in args.rate:
+        name, _, value = item.partition('=')
+        if name not in PAGERS or not value:
+            parser.error(f"bad --rate {item!r}, expected PROVIDER=N")
+        rates[name] = float(value)
+
+    end = datetime.now(timezone.utc).date()
+    start = date.fromisoformat(args.since) if args.since else end - timedelta(days=RANGE_DAYS[args.range])
+    torch_threads = args.torch_threads or max(1, cpus // args.workers)
+
+    store = SentimentStore(args.store)
+    if args.restart:
+        with store.conn:
+            store.conn.executemany('DELETE FROM checkpoints WHERE symbol = ?', [(s,) for s in symbols])
+
+    logger.info("Backfilling %d symbols from %s via %s (%d workers x %d torch threads)",
+                len(symbols), start, ', '.join(providers), args.workers, torch_threads)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=mp.get_context('spawn'),
+                             initializer=_init_worker, initargs=(torch_threads,)) as pool:
+        backfill(symbols, providers, start, end, store, pool, batch_size=args.batch_size,
+                 max_inflight=args.max_inflight, rates=rates, window_days=args.window_days,
+                 pooling=args.pooling, names=company_names(symbols))
+    logger.info("Backfill finished in %.0fs", time.perf_counter() - started)
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+"""
+Sentify Backend - Benchmarks
+Run from the backend directory, e.g. `python -m bench.model_sizing`
+"""
@@ -0,0 +1,86 @@
+"""
+Fixed benchmark data: FinBERT headline corpus and the symbol universe served by
+the mock providers. Keep this file stable so results stay comparable between runs.
+"""
+
+# (symbol, company name) pairs the mock providers know about
+SYMBOLS = [
+    ('AAPL', 'Apple Inc.'), ('TSLA', 'Tesla Inc.'), ('GOOGL', 'Alphabet Inc.'),
+    ('AMZN', 'Amazon.com Inc.'), ('MSFT', 'Microsoft Corporation'), ('NVDA', 'NVIDIA Corporation'),
+    ('META', 'Meta Platforms Inc.'), ('NFLX', 'Netflix Inc.'), ('AMD', 'Advanced Micro Devices Inc.'),
+    ('INTC', 'Intel Corporation'), ('WMT', 'Walmart Inc.'), ('JPM', 'JPMorgan Chase & Co.'),
+    ('V', 'Visa Inc.'), ('MA', 'Mastercard Inc.'), ('DIS', 'Walt Disney Co.'),
+    ('NKE', 'Nike Inc.'), ('SBUX', 'Starbucks Corporation'), ('PYPL', 'PayPal Holdings Inc.'),
+    ('UBER', 'Uber Technologies Inc.'), ('SPOT', 'Spotify Technology S.A.'),
+]
+
+# Search prefixes exercised against /api/search
+SEARCH_QUERIES = ['A', 'AP', 'APPLE', 'TES', 'MICRO', 'NV', 'META', 'NETF', 'AMD', 'INT',
+                  'WAL', 'JP', 'VISA', 'MAST', 'DIS', 'NIKE', 'STAR', 'PAY', 'UBER', 'SPOT']
+
+HEADLINES = [
+    "Apple reports record quarterly revenue as iPhone sales beat expectations",
+    "Tesla shares slide after deliveries miss analyst estimates",
+    "Microsoft raises dividend and announces $60 billion buyback",
+    "Amazon faces antitrust lawsuit over marketplace pricing practices",
+    "NVIDIA guidance tops forecasts on surging data center demand",
+    "Meta cuts capital spending outlook, stock falls in late trading",
+    "Netflix subscriber growth stalls in key markets",
+    "Intel delays next-generation chip, shares drop 8%",
+    "JPMorgan profit rises as higher rates lift lending income",
+    "Walmart keeps full-year outlook unchanged despite softer consumer spending",
+    "AMD wins major cloud contract, analysts upgrade to buy",
+    "Disney to cut 7,000 jobs in cost-saving overhaul",
+    "Visa transaction volumes steady in the third quarter",
+    "Nike warns of margin pressure from elevated inventory",
+    "PayPal names new chief executive, stock little changed",
+    "Starbucks same-store sales decline for second straight quarter",
+    "Alphabet beats on search revenue but cloud growth slows",
+    "Uber posts first annual operating profit since going public",
+    "Spotify raises subscription prices in several markets",
+    "Mastercard expands partnership with regional banks in Asia",
+    "Regulators open probe into Tesla driver-assistance software",
+    "Apple supplier cuts forecast citing weak smartphone demand",
+    "Microsoft cloud revenue growth accelerates for third quarter",
+    "Amazon to invest $10 billion in new data centers",
+    "NVIDIA shares hit all-time high after earnings",
+    "Meta fined by EU regulators over data transfers",
+    "Netflix ad-supported tier reaches 20 million users",
+    "Intel secures government subsidies for new fabrication plant",
+    "JPMorgan sets aside more reserves for potential loan losses",
+    "Walmart raises starting wages for store workers",
+    "AMD market share gains slow as competition intensifies",
+    "Disney streaming losses narrow more than expected",
+    "Visa settles long-running litigation with merchants",
+    "Nike sales rebound in China after lockdowns ease",
+    "PayPal lowers full-year margin guidance",
+    "Starbucks union talks stall as strikes spread",
+    "Alphabet faces second antitrust trial over ad tech business",
+    "Uber shares fall after ride volumes disappoint",
+    "Spotify podcast business still unprofitable, filings show",
+    "Mastercard quarterly earnings in line with estimates",
+    "Tesla cuts prices again in its largest market",
+    "Apple unveils new product lineup at annual event",
+    "Microsoft completes acquisition of gaming publisher",
+    "Amazon layoffs extend to devices and advertising units",
+    "NVIDIA faces new export restrictions on advanced chips",
+    "Meta's virtual reality unit reports widening operating loss",
+    "Netflix password-sharing crackdown boosts sign-ups",
+    "Intel reports first quarterly loss in decades",
+    "JPMorgan chief warns of storm clouds ahead for the economy",
+    "Walmart e-commerce sales grow 24% year over year",
+    "AMD completes purchase of adaptive chip maker",
+    "Disney shareholders reject activist board nominees",
+    "Visa and Mastercard delay planned fee increases",
+    "Nike shares jump on stronger-than-expected margins",
+    "PayPal launches dollar-pegged stablecoin",
+    "Starbucks opens 1,000th store in new market",
+    "Alphabet announces $70 billion share repurchase",
+    "Uber and food delivery partners settle contractor dispute",
+    "Spotify cuts workforce by 17% to reduce costs",
+    "Mastercard reports cross-border travel spending above pre-pandemic levels",
+    "Tesla recalls vehicles over steering issue",
+    "Apple market value tops $3 trillion",
+    "Microsoft faces outage affecting enterprise customers",
+    "Amazon Prime Day sales set new record",
+]
@@ -0,0 +1,232 @@
+"""
+Offline load test for the Sentify backend
+
+Starts the mock providers, launches the backend (serve.py) pointed at them, then
+drives /api/search, /api/news and /api/sentiment/finbert concurrently and reports
+throughput and p50/p95/p99 latency per endpoint. No API keys or internet needed.
+
+Usage:
+    python -m bench.loadtest --concurrency 16 --requests 300
+    python -m bench.loadtest --output baseline.json
+    python -m bench.loadtest --compare baseline.json --max-regression 0.15
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from bench.corpus import SYMBOLS, SEARCH_QUERIES, HEADLINES
+from bench.mock_providers import (
+    default_profiles, apply_overrides, start_mock_providers, stop_mock_providers, mock_environment
+)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENDPOINTS = ['search', 'news', 'finbert']
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_backend(args, env_overrides):
+    """Launch serve.py in a subprocess and wait until /health answers"""
+    port = free_port()
+    env = dict(os.environ)
+    env.update(env_overrides)
+    env['CACHE_DURATION'] = str(args.cache_duration)
+    cmd = [sys.executable, 'serve.py', '--server', args.server, '--host', '127.0.0.1', '--port', str(port),
+           '--workers', str(args.workers), '--threads', str(args.threads)]
+    if args.torch_threads:
+        cmd += ['--torch-threads', str(args.torch_threads)]
+    log = open(args.server_log, 'w') if args.server_log else subprocess.DEVNULL
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + args.startup_timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Backend exited during startup (code {proc.returncode})")
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return proc, base_url
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError(f"Backend did not become healthy within {args.startup_timeout}s")
+
+
+def build_requests(endpoint, count, finbert_batch):
+    """Deterministic request list for one endpoint: (method, path, params, json_body)"""
+    plans = []
+    for i in range(count):
+        if endpoint == 'search':
+            plans.append(('GET', '/api/search', {'q': SEARCH_QUERIES[i % len(SEARCH_QUERIES)]}, None))
+        elif endpoint == 'news':
+            symbol = SYMBOLS[i % len(SYMBOLS)][0]
+            depth = ['quick', 'standard', 'deep'][i % 3]
+            plans.append(('GET', '/api/news', {'symbol': symbol, 'range': '1w', 'depth': depth}, None))
+        else:
+            start = (i * finbert_batch) % len(HEADLINES)
+            texts = [HEADLINES[(start + j) % len(HEADLINES)] for j in range(finbert_batch)]
+            plans.append(('POST', '/api/sentiment/finbert', None, {'texts': texts}))
+    return plans
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_endpoint(base_url, endpoint, args):
+    """Fire all requests for one endpoint with `concurrency` client threads"""
+    plans = build_requests(endpoint, args.requests, args.finbert_batch)
+    local = threading.local()
+
+    def call(plan):
+        method, path, params, body = plan
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        started = time.perf_counter()
+        try:
+            response = local.session.request(method, base_url + path, params=params, json=body,
+                                             timeout=args.request_timeout)
+            ok = response.status_code == 200
+            size = len(response.content)
+        except requests.RequestException:
+            ok, size = False, 0
+        return (time.perf_counter() - started) * 1000, ok, size
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        outcomes = list(pool.map(call, plans))
+    wall = time.perf_counter() - wall_started
+
+    latencies = sorted(ms for ms, _, _ in outcomes)
+    errors = sum(1 for _, ok, _ in outcomes if not ok)
+    return {
+        'requests': len(outcomes),
+        'errors': errors,
+        'throughput_rps': round(len(outcomes) / wall, 2),
+        'p50_ms': round(percentile(latencies, 50), 1),
+        'p95_ms': round(percentile(latencies, 95), 1),
+        'p99_ms': round(percentile(latencies, 99), 1),
+        'avg_bytes': int(sum(size for _, _, size in outcomes) / max(1, len(outcomes))),
+    }
+
+
+def print_report(results):
+    print(f"{'endpoint':<10} {'reqs':>6} {'errors':>6} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'bytes':>8}")
+    for endpoint, stats in results.items():
+        print(f"{endpoint:<10} {stats['requests']:>6} {stats['errors']:>6} {stats['throughput_rps']:>8.1f} "
+              f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['avg_bytes']:>8}")
+
+
+def compare(results, baseline_path, max_regression):
+    """Compare p95 and throughput with a saved run; returns False if anything regressed"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    passed = True
+    print(f"\nComparison with {baseline_path} (allowed regression {max_regression:.0%}):")
+    for endpoint, stats in results.items():
+        if endpoint not in baseline:
+            continue
+        base = baseline[endpoint]
+        p95_delta = (stats['p95_ms'] - base['p95_ms']) / base['p95_ms'] if base['p95_ms'] else 0.0
+        rps_delta = (base['throughput_rps'] - stats['throughput_rps']) / base['throughput_rps'] if base['throughput_rps'] else 0.0
+        regressed = p95_delta > max_regression or rps_delta > max_regression
+        passed = passed and not regressed
+        status = 'REGRESSED' if regressed else 'ok'
+        print(f"  {endpoint:<10} p95 {base['p95_ms']:.1f} -> {stats['p95_ms']:.1f} ms ({p95_delta:+.0%}), "
+              f"req/s {base['throughput_rps']:.1f} -> {stats['throughput_rps']:.1f}  [{status}]")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the Sentify backend")
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS),
+                        help="Comma-separated subset of: search,news,finbert")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent client threads")
+    parser.add_argument('--requests', type=int, default=200, help="Requests per endpoint")
+    parser.add_argument('--finbert-batch', type=int, default=8, help="Texts per /api/sentiment/finbert request")
+    parser.add_argument('--request-timeout', type=float, default=120)
+    parser.add_argument('--set', dest='overrides', action='append', default=[],
+                        help="Mock provider override, e.g. finnhub.latency_ms=500 or all.rate_429=0.1")
+    parser.add_argument('--cache-duration', type=int, default=0,
+                        help="CACHE_DURATION for the backend; 0 measures the uncached path")
+    parser.add_argument('--server', default='auto', choices=['auto', 'gunicorn', 'waitress'])
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--torch-threads', type=int, default=0)
+    parser.add_argument('--startup-timeout', type=int, default=300, help="Seconds to wait for model load")
+    parser.add_argument('--server-log', help="Write backend stdout/stderr to this file")
+    parser.add_argument('--target', help="Benchmark an already running backend instead of starting one")
+    parser.add_argument('--output', help="Save results as JSON (use as a --compare baseline)")
+    parser.add_argument('--compare', help="Baseline JSON from a previous --output run")
+    parser.add_argument('--max-regression', type=float, default=0.15,
+                        help="Fail if p95 or throughput is worse than baseline by more than this fraction")
+    args = parser.parse_args()
+
+    endpoints = [e.strip() for e in args.endpoints.split(',') if e.strip()]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+    profiles = apply_overrides(default_profiles(), args.overrides)
+    servers = None
+    backend = None
+    try:
+        if args.target:
+            base_url = args.target.rstrip('/')
+        else:
+            servers = start_mock_providers(profiles)
+            print("Starting backend against mock providers (model load may take a while)...")
+            backend, base_url = start_backend(args, mock_environment(servers))
+
+        print(f"Target {base_url}: concurrency={args.concurrency} requests/endpoint={args.requests}")
+        results = {}
+        for endpoint in endpoints:
+            results[endpoint] = run_endpoint(base_url, endpoint, args)
+        print_report(results)
+
+        if servers:
+            print("\nMock provider traffic: " + ", ".join(
+                f"{name}={server.stats['requests']} ({server.stats['rate_limited']} x 429)"
+                for name, server in servers.items()))
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump({
+                    'config': {k: v for k, v in vars(args).items() if k not in ('output', 'compare')},
+                    'profiles': {name: profile.to_dict() for name, profile in profiles.items()},
+                    'results': results,
+                }, f, indent=2)
+            print(f"\nSaved results to {args.output}")
+
+        if args.compare and not compare(results, args.compare, args.max_regression):
+            sys.exit(1)
+    finally:
+        if backend:
+            backend.terminate()
+            try:
+                backend.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                backend.kill()
+        if servers:
+            stop_mock_providers(servers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Local stand-ins for the news and market data providers used by app.py
+
+Each provider (Finnhub, Alpha Vantage, NewsData, NewsAPI, Polygon) gets its own
+HTTP server that answers the endpoints app.py calls with the same JSON shape as
+the real API. Latency, 429 rate and payload size are configurable per provider.
+
+Run standalone to point a manually started backend at the mocks:
+    python -m bench.mock_providers --set finnhub.latency_ms=250 --set all.rate_429=0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from bench.corpus import SYMBOLS, HEADLINES
+
+PROVIDERS = ['finnhub', 'alphavantage', 'newsdata', 'newsapi', 'polygon']
+
+COMPANY_NAMES = dict(SYMBOLS)
+
+
+class ProviderProfile:
+    """Behaviour knobs for one mock provider"""
+
+    FIELDS = ('latency_ms', 'jitter_ms', 'rate_429', 'articles', 'summary_chars')
+
+    def __init__(self, latency_ms=80, jitter_ms=20, rate_429=0.0, articles=50, summary_chars=400):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.articles = articles
+        self.summary_chars = summary_chars
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+def default_profiles():
+    return {provider: ProviderProfile() for provider in PROVIDERS}
+
+
+def apply_overrides(profiles, overrides):
+    """
+    Apply 'provider.field=value' overrides; 'all.field=value' applies to every provider
+    e.g. ['finnhub.latency_ms=500', 'all.rate_429=0.1']
+    """
+    for override in overrides or []:
+        target, _, value = override.partition('=')
+        provider, _, field = target.partition('.')
+        if field not in ProviderProfile.FIELDS:
+            raise ValueError(f"Unknown profile field in override: {override}")
+        names = PROVIDERS if provider == 'all' else [provider]
+        for name in names:
+            if name not in profiles:
+                raise ValueError(f"Unknown provider in override: {override}")
+            current = getattr(profiles[name], field)
+            setattr(profiles[name], field, type(current)(float(value)) if isinstance(current, int) else float(value))
+    return profiles
+
+
+def _seed(*parts):
+    """Stable per-input seed so repeated requests return identical payloads"""
+    return zlib.crc32('|'.join(str(p) for p in parts).encode())
+
+
+def _price(symbol):
+    rng = random.Random(_seed('price', symbol))
+    price = round(rng.uniform(20, 900), 2)
+    return price, round(price - rng.uniform(-10, 10), 2)
+
+
+def _articles(symbol, count, summary_chars):
+    """Generate `count` deterministic articles that pass app.is_relevant_news for `symbol`"""
+    company = COMPANY_NAMES.get(symbol, symbol)
+    now = datetime.utcnow()
+    articles = []
+    for idx in range(count):
+        headline = HEADLINES[(_seed(symbol) + idx) % len(HEADLINES)]
+        sentence = f"{company} ({symbol}) update: {headline}. "
+        summary = (sentence * (summary_chars // len(sentence) + 1))[:summary_chars]
+        articles.append({
+            'title': f"{symbol}: {headline}",
+            'summary': summary,
+            'url': f"https://news.example.com/{symbol.lower()}/{idx}",
+            'source': ['Reuters', 'Bloomberg', 'CNBC', 'MarketWatch'][idx % 4],
+            'published': now - timedelta(hours=idx),
+        })
+    return articles
+
+
+def _finnhub(path, params, profile):
+    if path.endswith('/search'):
+        query = params.get('q', '').upper()
+        matches = [{'description': name, 'displaySymbol': sym, 'symbol': sym, 'type': 'Common Stock'}
+                   for sym, name in SYMBOLS if sym.startswith(query) or query in name.upper()]
+        return {'count': len(matches), 'result': matches}
+    if path.endswith('/quote'):
+        price, prev = _price(params.get('symbol', ''))
+        return {'c': price, 'pc': prev, 'h': price, 'l': prev, 'o': prev, 't': int(time.time())}
+    if path.endswith('/company-news'):
+        return [{'headline': a['title'], 'source': a['source'], 'datetime': int(a['published'].timestamp()),
+                 'url': a['url'], 'summary': a['summary']}
+                for a in _articles(params.get('symbol', ''), profile.articles, profile.summary_chars)]
+    return None
+
+
+def _alphavantage(path, params, profile):
+    function = params.get('function')
+    if function == 'GLOBAL_QUOTE':
+        price, prev = _price(params.get('symbol', ''))
+        return {'Global Quote': {'01. symbol': params.get('symbol', ''), '05. price': f"{price:.4f}",
+                                 '08. previous close': f"{prev:.4f}"}}
+    if function == 'NEWS_SENTIMENT':
+        return {'items': str(profile.articles), 'feed': [
+            {'title': a['title'], 'source': a['source'], 'time_published': a['published'].strftime('%Y%m%dT%H%M%S'),
+             'url': a['url'], 'summary': a['summary']}
+            for a in _articles(params.get('tickers', ''), profile.articles, profile.summary_chars)]}
+    return None
+
+
+def _newsdata(path, params, profile):
+    return {'status': 'success', 'results': [
+        {'title': a['title'], 'source_id': a['source'].lower(), 'pubDate': a['published'].strftime('%Y-%m-%d %H:%M:%S'),
+         'link': a['url'], 'description': a['summary']}
+        for a in _articles(params.get('q', ''), profile.articles, profile.summary_chars)]}
+
+
+def _newsapi(path, params, profile):
+    # The app queries "SYMBOL OR Company Name"
+    symbol = params.get('q', '').split(' OR ')[0]
+    articles = _articles(symbol, profile.articles, profile.summary_chars)
+    return {'status': 'ok', 'totalResults': len(articles), 'articles': [
+        {'source': {'id': None, 'name': a['source']}, 'title': a['title'], 'description': a['summary'],
+         'url': a['url'], 'publishedAt': a['published'].strftime('%Y-%m-%dT%H:%M:%SZ')}
+        for a in articles]}
+
+
+def _polygon(path, params, profile):
+    return {'status': 'OK', 'results': [
+        {'title': a['title'], 'publisher': {'name': a['source']},
+         'published_utc': a['published'].strftime('%Y-%m-%dT%H:%M:%SZ'), 'article_url': a['url'],
+         'description': a['summary']}
+        for a in _articles(params.get('ticker', ''), profile.articles, profile.summary_chars)]}
+
+
+ROUTES = {
+    'finnhub': _finnhub,
+    'alphavantage': _alphavantage,
+    'newsdata': _newsdata,
+    'newsapi': _newsapi,
+    'polygon': _polygon,
+}
+
+
+class MockProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        profile = server.profile
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        delay = max(0.0, random.gauss(profile.latency_ms, profile.jitter_ms)) / 1000
+        if delay:
+            time.sleep(delay)
+
+        with server.stats_lock:
+            server.stats['requests'] += 1
+
+        if random.random() < profile.rate_429:
+            with server.stats_lock:
+                server.stats['rate_limited'] += 1
+            self._send(429, {'status': 'error', 'code': 'rateLimited',
+                             'message': 'You have exceeded your request quota (mock)'})
+            return
+
+        payload = ROUTES[server.provider](parsed.path, params, profile)
+        if payload is None:
+            self._send(404, {'error': f"Unknown mock endpoint {parsed.path}"})
+        else:
+            self._send(200, payload)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Per-request access logs would dominate benchmark output
+        pass
+
+
+def start_mock_providers(profiles=None, host='127.0.0.1'):
+    """
+    Start one mock server per provider on a free port, each in a daemon thread
+    Returns: {provider: server}; server.url is its base URL and server.stats its counters
+    """
+    profiles = profiles or default_profiles()
+    servers = {}
+    for provider in PROVIDERS:
+        server = ThreadingHTTPServer((host, 0), MockProviderHandler)
+        server.daemon_threads = True
+        server.provider = provider
+        server.profile = profiles[provider]
+        server.stats = {'requests': 0, 'rate_limited': 0}
+        server.stats_lock = threading.Lock()
+        server.url = f"http://{host}:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, name=f"mock-{provider}", daemon=True).start()
+        servers[provider] = server
+    return servers
+
+
+def stop_mock_providers(servers):
+    for server in servers.values():
+        server.shutdown()
+        server.server_close()
+
+
+def mock_environment(servers):
+    """Environment variables that point app.py at the mock servers"""
+    return {
+        'FINNHUB_BASE_URL': f"{servers['finnhub'].url}/api/v1",
+        'ALPHA_VANTAGE_BASE_URL': servers['alphavantage'].url,
+        'NEWSDATA_BASE_URL': f"{servers['newsdata'].url}/api/1",
+        'NEWSAPI_BASE_URL': f"{servers['newsapi'].url}/v2",
+        'POLYGON_BASE_URL': servers['polygon'].url,
+        'FINNHUB_API_KEY': 'mock-finnhub-1',
+        'FINNHUB_API_KEY_2': 'mock-finnhub-2',
+        'ALPHA_VANTAGE_KEY': 'mock-alphavantage',
+        'NEWSDATA_API_KEY': 'mock-newsdata',
+        'NEWS_API_KEY': 'mock-newsapi',
+        'POLYGON_API_KEY': 'mock-polygon',
+        'DISABLE_YFINANCE': '1',
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run mock provider servers for offline testing")
+    parser.add_argument('--set', dest='overrides', action='append', default=[],
+                        help="Profile override, e.g. finnhub.latency_ms=500 or all.rate_429=0.1")
+    args = parser.parse_args()
+
+    servers = start_mock_providers(apply_overrides(default_profiles(), args.overrides))
+    print("Mock providers running. Export these before starting the backend:")
+    for key, value in mock_environment(servers).items():
+        print(f"  {key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stop_mock_providers(servers)
+
+
+if __name__ == '__main__':
+    main()
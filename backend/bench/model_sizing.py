@@ -0,0 +1,124 @@
+"""
+FinBERT sizing benchmark
+
+Measures FinBERT scoring throughput for combinations of worker processes and
+torch intra-op threads. Each timed call scores one request-sized batch of
+headlines through finbert_probabilities_batch(), the chunked, length-sorted
+path that /api/sentiment/finbert serves, so latencies are per request. The
+output is what the sizing guidance in README.md is based on.
+
+Usage:
+    python -m bench.model_sizing --workers 1,2,4 --torch-threads 1,2,4
+    python -m bench.model_sizing --batch-size 32
+"""
+import argparse
+import multiprocessing as mp
+import os
+import statistics
+import time
+
+from bench.corpus import HEADLINES
+
+
+def _score_loop(torch_threads, rounds, batch_size, barrier, results):
+    """Worker process: load the model with the given thread count and time batched scoring"""
+    import finbert
+
+    if not finbert.load_model(torch_threads):
+        results.put(None)
+        return
+
+    # Request-sized batches, cycling through the headline set like bench.loadtest does
+    batches = [[HEADLINES[(start + j) % len(HEADLINES)] for j in range(batch_size)]
+               for start in range(0, len(HEADLINES), batch_size)]
+
+    # Warm-up so lazy initialisation doesn't skew the first timings
+    finbert.finbert_probabilities_batch(batches[0])
+
+    barrier.wait()
+    per_request_ms = []
+    texts = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for batch in batches:
+            t0 = time.perf_counter()
+            finbert.finbert_probabilities_batch(batch)
+            per_request_ms.append((time.perf_counter() - t0) * 1000)
+            texts += len(batch)
+    elapsed = time.perf_counter() - started
+
+    rss_mb = None
+    try:
+        import resource
+        # ru_maxrss is KiB on Linux
+        rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        pass
+
+    results.put((texts, elapsed, per_request_ms, rss_mb))
+
+
+def run_config(workers, torch_threads, rounds, batch_size):
+    """Run one (workers, torch_threads) combination and return aggregate stats"""
+    ctx = mp.get_context('spawn')
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_score_loop, args=(torch_threads, rounds, batch_size, barrier, results))
+             for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    outputs = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+
+    if any(output is None for output in outputs):
+        return None
+
+    total_texts = sum(count for count, _, _, _ in outputs)
+    wall = max(elapsed for _, elapsed, _, _ in outputs)
+    latencies = sorted(ms for _, _, per_request, _ in outputs for ms in per_request)
+    rss = [r for _, _, _, r in outputs if r is not None]
+    return {
+        'texts_per_sec': total_texts / wall,
+        'p50_ms': statistics.median(latencies),
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1],
+        'rss_mb': max(rss) if rss else None,
+    }
+
+
+def parse_list(value):
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="FinBERT worker/thread sizing benchmark")
+    parser.add_argument('--workers', type=parse_list, default=[1, 2],
+                        help="Comma-separated worker counts to try")
+    parser.add_argument('--torch-threads', type=parse_list, default=[1, 2, 4],
+                        help="Comma-separated torch intra-op thread counts to try")
+    parser.add_argument('--rounds', type=int, default=5,
+                        help="Passes over the headline set per worker")
+    parser.add_argument('--batch-size', type=int, default=8,
+                        help="Texts per scoring call, like bench.loadtest --finbert-batch")
+    args = parser.parse_args()
+
+    print(f"Host: {cpu_count} logical CPUs, {len(HEADLINES)} headlines x {args.rounds} rounds per worker, "
+          f"{args.batch_size} texts per request")
+    print(f"{'workers':>7} {'torch':>5} {'texts/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'max RSS MB':>10}")
+    for workers in args.workers:
+        for torch_threads in args.torch_threads:
+            if workers * torch_threads > cpu_count:
+                print(f"{workers:>7} {torch_threads:>5}   skipped (oversubscribes {cpu_count} CPUs)")
+                continue
+            stats = run_config(workers, torch_threads, args.rounds, args.batch_size)
+            if stats is None:
+                print("[WARNING] FinBERT model not available, aborting")
+                return
+            rss = f"{stats['rss_mb']:.0f}" if stats['rss_mb'] is not None else 'n/a'
+            print(f"{workers:>7} {torch_threads:>5} {stats['texts_per_sec']:>9.1f} "
+                  f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {rss:>10}")
+
+
+if __name__ == '__main__':
+    main()
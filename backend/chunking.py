@@ -0,0 +1,77 @@
+"""
+Sentify Backend - Long Text Chunking
+Splits texts longer than FinBERT's 512-token window into sentence-aligned
+chunks and pools per-chunk scores back into one score per text, so long
+articles are scored in full instead of being truncated to the first window.
+
+Chunks from every text in a request are scored together (app.py sorts them by
+length and runs them in shared batches), so cost grows with the total amount
+of text rather than with the number of texts.
+"""
+import re
+
+import torch
+
+POOLING_METHODS = ('mean', 'max', 'attention')
+
+# Lower values concentrate attention pooling on the most opinionated chunks
+ATTENTION_TEMPERATURE = 0.25
+
+# Sentence ends: ., ! or ? (optionally followed by a closing quote/bracket) then whitespace
+_SENTENCE_END = re.compile(r'(?<=[.!?])["\')\]]?\s+')
+
+
+def split_sentences(text):
+    return [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+
+
+def chunk_token_ids(tokenizer, texts, max_tokens):
+    """
+    Tokenize `texts` and pack each one's sentences into windows of at most
+    `max_tokens` tokens (special tokens excluded). A sentence longer than a
+    window is split at token boundaries.
+    Returns: list of (text index, token ids); every text gets at least one chunk
+    """
+    sentences = [split_sentences(text) or [''] for text in texts]
+    # One tokenizer call for every sentence of every text
+    encoded = tokenizer([s for doc in sentences for s in doc], add_special_tokens=False)['input_ids']
+
+    chunks = []
+    position = 0
+    for doc_idx, doc in enumerate(sentences):
+        current = []
+        first_chunk = len(chunks)
+        for ids in encoded[position:position + len(doc)]:
+            while len(ids) > max_tokens:
+                if current:
+                    chunks.append((doc_idx, current))
+                    current = []
+                chunks.append((doc_idx, ids[:max_tokens]))
+                ids = ids[max_tokens:]
+            if current and len(current) + len(ids) > max_tokens:
+                chunks.append((doc_idx, current))
+                current = []
+            current = current + ids
+        position += len(doc)
+        if current or len(chunks) == first_chunk:
+            chunks.append((doc_idx, current))
+    return chunks
+
+
+def pool_scores(probabilities, lengths, method='mean'):
+    """
+    Combine one text's per-chunk [positive, negative, neutral] rows into one row
+    - mean: token-length-weighted mean
+    - max: the chunk with the largest |positive - negative|
+    - attention: length-weighted, with softmax weights favouring non-neutral chunks
+    """
+    if len(probabilities) == 1:
+        return probabilities[0]
+    if method == 'max':
+        polarity = (probabilities[:, 0] - probabilities[:, 1]).abs()
+        return probabilities[polarity.argmax()]
+    weights = lengths.to(probabilities.dtype)
+    if method == 'attention':
+        weights = weights * torch.softmax((1 - probabilities[:, 2]) / ATTENTION_TEMPERATURE, dim=0)
+    weights = weights / weights.sum()
+    return (weights[:, None] * probabilities).sum(dim=0)
@@ -0,0 +1,120 @@
+"""
+Sentify Backend - FinBERT
+Loads the ProsusAI/finbert model and scores texts in batched, chunked passes.
+
+Kept apart from app.py so offline jobs (backfill.py) and benchmarks can load
+the model in worker processes without building the Flask app, its provider
+clients and the symbol index.
+"""
+import logging
+import os
+
+import torch
+import torch.nn.functional as F
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+from chunking import chunk_token_ids, pool_scores
+from metrics import span, FINBERT_CHUNKS_PER_TEXT
+from records import ScoreBatch
+
+logger = logging.getLogger('sentify.finbert')
+
+# BERT's 512-position window, minus room for [CLS] and [SEP]
+MAX_TOKENS = 510
+
+finbert_tokenizer = None
+finbert_model = None
+
+
+def load_model(torch_threads=None):
+    """
+    Load FinBERT once per process, limiting torch intra-op threads to
+    `torch_threads` (default TORCH_NUM_THREADS; 0 leaves torch's default)
+    Returns: True if the model is available
+    """
+    global finbert_tokenizer, finbert_model
+    if finbert_model is not None:
+        return True
+    if torch_threads is None:
+        torch_threads = int(os.getenv('TORCH_NUM_THREADS', '0'))
+    # Limit torch intra-op threads so several workers don't oversubscribe the CPU
+    if torch_threads > 0:
+        torch.set_num_threads(torch_threads)
+
+    logger.info("Loading FinBERT model...")
+    try:
+        tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
+        model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
+        model.eval()
+    except Exception as e:
+        logger.warning("FinBERT model failed to load: %s", e)
+        return False
+    finbert_tokenizer, finbert_model = tokenizer, model
+    logger.info("FinBERT model loaded successfully")
+    return True
+
+
+def finbert_probabilities(text, pooling='mean'):
+    """
+    Run FinBERT on one text (long texts are chunked and pooled)
+    Returns: [positive, negative, neutral] probabilities, or None on failure
+    """
+    return finbert_probabilities_batch([text], pooling=pooling)[0]
+
+
+def finbert_probabilities_batch(texts, batch_size=32, pooling='mean'):
+    """
+    Run FinBERT over many texts in one batched pass
+    Texts longer than the 512-token window are split into sentence-aligned chunks
+    (chunking.py); chunks from all texts are sorted by length, scored in shared
+    padded batches and pooled back per text with `pooling` ('mean', 'max', 'attention').
+    Returns: one [positive, negative, neutral] list (or None on failure) per text
+    """
+    if finbert_model is None:
+        return [None] * len(texts)
+
+    cls_id, sep_id = finbert_tokenizer.cls_token_id, finbert_tokenizer.sep_token_id
+    with span('tokenize'):
+        chunks = chunk_token_ids(finbert_tokenizer, texts, MAX_TOKENS)
+    FINBERT_CHUNKS_PER_TEXT.observe(len(chunks) / max(len(texts), 1))
+
+    # Similar lengths share a batch, so little time goes into padding
+    order = sorted(range(len(chunks)), key=lambda i: len(chunks[i][1]))
+    chunk_scores = [None] * len(chunks)
+    for offset in range(0, len(order), batch_size):
+        batch = order[offset:offset + batch_size]
+        try:
+            with span('tokenize'):
+                inputs = finbert_tokenizer.pad(
+                    {'input_ids': [[cls_id, *chunks[i][1], sep_id] for i in batch]},
+                    return_tensors="pt")
+            with span('model_forward'), torch.no_grad():
+                # FinBERT outputs: [positive, negative, neutral]
+                predictions = F.softmax(finbert_model(**inputs).logits, dim=-1)
+            for row, i in zip(predictions, batch):
+                chunk_scores[i] = row
+        except Exception as e:
+            logger.error("FinBERT analysis error: %s", e)
+
+    per_text = [[] for _ in texts]
+    for (text_idx, ids), scores in zip(chunks, chunk_scores):
+        per_text[text_idx].append((len(ids), scores))
+    results = []
+    for scored in per_text:
+        if any(scores is None for _, scores in scored):
+            results.append(None)
+            continue
+        pooled = pool_scores(torch.stack([scores for _, scores in scored]),
+                             torch.tensor([max(length, 1) for length, _ in scored]), pooling)
+        results.append(pooled.tolist())
+    return results
+
+
+def analyze_sentiment_finbert(text):
+    """
+    Analyze sentiment using FinBERT model
+    Returns: {'sentiment': 'positive'|'negative'|'neutral', 'confidence': float, 'scores': {}}
+    """
+    scores = ScoreBatch()
+    scores.append(finbert_probabilities(text))
+    return scores.result(0)
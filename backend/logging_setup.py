@@ -0,0 +1,15 @@
+"""
+Sentify Backend - Logging
+Shared logging configuration for app.py and serve.py. The level comes from
+LOG_LEVEL (DEBUG, INFO, WARNING, ERROR; default INFO).
+"""
+import logging
+import os
+
+LOG_FORMAT = '%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s'
+
+
+def configure_logging():
+    """Configure root logging once; later calls are no-ops"""
+    level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    logging.basicConfig(level=getattr(logging, level, logging.INFO), format=LOG_FORMAT)
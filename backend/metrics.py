@@ -0,0 +1,179 @@
+"""
+Sentify Backend - Metrics
+Minimal thread-safe counters and histograms rendered in the Prometheus text
+exposition format (served by app.py at /metrics). Kept dependency-free and
+cheap enough to call on every request.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+REGISTRY = []
+
+
+def _format_labels(labelnames, key, extra=None):
+    pairs = list(zip(labelnames, key))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+    type_name = 'counter'
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def collect(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in items]
+
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels"""
+    type_name = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}  # key -> [per-bucket counts (+Inf last), sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def collect(self):
+        with self._lock:
+            items = [(key, list(state[0]), state[1], state[2]) for key, state in self._values.items()]
+        lines = []
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+def counter(name, help_text, labelnames=()):
+    metric = Counter(name, help_text, labelnames)
+    REGISTRY.append(metric)
+    return metric
+
+
+def histogram(name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+    metric = Histogram(name, help_text, labelnames, buckets)
+    REGISTRY.append(metric)
+    return metric
+
+
+def render():
+    """Render every registered metric in Prometheus text format"""
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.help_text}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        lines.extend(metric.collect())
+    return '\n'.join(lines) + '\n'
+
+
+# Application metrics
+HTTP_REQUEST_SECONDS = histogram(
+    'sentify_http_request_seconds', 'HTTP request latency by endpoint and status', ('endpoint', 'method', 'status'))
+CACHE_REQUESTS = counter(
+    'sentify_cache_requests_total', 'Cache lookups by cache and result (hit/miss)', ('cache', 'result'))
+PROVIDER_REQUEST_SECONDS = histogram(
+    'sentify_provider_request_seconds', 'Upstream provider HTTP latency', ('provider', 'key'))
+PROVIDER_REQUESTS = counter(
+    'sentify_provider_requests_total',
+    'Upstream provider calls by outcome (ok, rate_limited, http_error, exception)', ('provider', 'key', 'outcome'))
+PROVIDER_EMPTY_RESULTS = counter(
+    'sentify_provider_empty_results_total', 'Provider calls that returned no usable articles', ('provider',))
+STAGE_SECONDS = histogram(
+    'sentify_stage_seconds', 'Time spent per pipeline stage', ('stage',))
+FINBERT_BATCH_SIZE = histogram(
+    'sentify_finbert_batch_size', 'Texts per FinBERT scoring request', buckets=SIZE_BUCKETS)
+FINBERT_SECONDS_PER_TEXT = histogram(
+    'sentify_finbert_seconds_per_text', 'FinBERT model time per text actually scored (cache hits excluded)',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+FINBERT_CHUNKS_PER_TEXT = histogram(
+    'sentify_finbert_chunks_per_text', 'Average 512-token chunks per text in a FinBERT scoring call',
+    buckets=(1, 1.5, 2, 3, 4, 6, 8, 16))
+
+
+# Per-request list of (stage, seconds), set only while a request is being traced
+_stage_trace = ContextVar('stage_trace', default=None)
+
+
+def start_stage_trace():
+    """Begin collecting stage timings for the current request"""
+    _stage_trace.set([])
+
+
+def stop_stage_trace():
+    """Stop collecting and return the (stage, seconds) list gathered since start_stage_trace"""
+    trace = _stage_trace.get()
+    _stage_trace.set(None)
+    return trace or []
+
+
+def trace_stage(stage, seconds):
+    """Add a timing to the current request trace without recording a histogram sample"""
+    trace = _stage_trace.get()
+    if trace is not None:
+        trace.append((stage, seconds))
+
+
+@contextmanager
+def span(stage):
+    """Time a pipeline stage: `with span('tokenize'): ...`"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=stage)
+        trace_stage(stage, elapsed)
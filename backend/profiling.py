@@ -0,0 +1,236 @@
+"""
+Sentify Backend - Profiling
+Opt-in request profiling and slow-request capture. Nothing is registered unless
+PROFILING_ENABLED=1, so there is no per-request cost when it is off.
+
+- `?profile=1` (or header `X-Sentify-Profile: 1`) returns a cProfile breakdown
+  instead of the normal response; `?profile=pyinstrument` uses pyinstrument if
+  it is installed.
+- Requests slower than SLOW_REQUEST_MS are kept in a ring buffer with their
+  stage timings and sampled stacks; GET /admin/slow-requests dumps it.
+- Both require ADMIN_TOKEN to be set and sent in an `X-Admin-Token` header;
+  without a token, profile requests are ignored and the endpoint returns 403.
+"""
+import cProfile
+import hmac
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+
+from flask import g, jsonify, request
+
+from metrics import start_stage_trace, stop_stage_trace
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:
+    PyinstrumentProfiler = None
+
+logger = logging.getLogger('sentify.profiling')
+
+# Frames from these files are dropped from sampled stacks to keep them readable
+_STACK_NOISE = ('threading.py', 'socketserver.py', 'werkzeug', 'gunicorn', 'waitress')
+
+
+def _collapse_stack(frame, limit=40):
+    """Render a frame chain as 'outer;...;inner' (flame-graph collapsed format)"""
+    parts = []
+    while frame is not None and len(parts) < limit:
+        code = frame.f_code
+        if not any(noise in code.co_filename for noise in _STACK_NOISE):
+            parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return ';'.join(reversed(parts))
+
+
+class SlowRequestMonitor:
+    """
+    Tracks in-flight requests and samples the stacks of those running past the
+    threshold; finished slow requests are kept in a bounded ring buffer.
+    """
+
+    def __init__(self, threshold_ms, interval_ms, capacity):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.records = deque(maxlen=capacity)
+        self._active = {}  # thread id -> (started, Counter of collapsed stacks)
+        self._lock = threading.Lock()
+        self._sampler = None
+        self._sampler_pid = None
+
+    def _ensure_sampler(self):
+        # Started lazily so each forked gunicorn worker gets its own thread
+        if self._sampler_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sampler_pid == os.getpid():
+                return
+            self._sampler = threading.Thread(target=self._sample_loop, name='slow-request-sampler', daemon=True)
+            self._sampler.start()
+            self._sampler_pid = os.getpid()
+
+    def _sample_loop(self):
+        while True:
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            with self._lock:
+                overdue = [(tid, samples) for tid, (started, samples) in self._active.items()
+                           if now - started >= self.threshold]
+            if not overdue:
+                continue
+            frames = sys._current_frames()
+            for tid, samples in overdue:
+                frame = frames.get(tid)
+                if frame is not None:
+                    samples[_collapse_stack(frame)] += 1
+
+    def begin(self):
+        self._ensure_sampler()
+        with self._lock:
+            self._active[threading.get_ident()] = (time.perf_counter(), Counter())
+
+    def discard(self):
+        with self._lock:
+            self._active.pop(threading.get_ident(), None)
+
+    def end(self, status, stages):
+        with self._lock:
+            started, samples = self._active.pop(threading.get_ident(), (None, None))
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        if elapsed < self.threshold:
+            return
+        self.records.append({
+            'method': request.method,
+            'path': request.path,
+            'args': request.args.to_dict(),
+            'status': status,
+            'duration_ms': round(elapsed * 1000, 1),
+            'finishedAt': datetime.now().isoformat(),
+            'stages': [{'stage': stage, 'ms': round(seconds * 1000, 2)} for stage, seconds in stages],
+            'stacks': [{'stack': stack, 'samples': count} for stack, count in samples.most_common(20)],
+            'sampleIntervalMs': round(self.interval * 1000),
+        })
+        logger.warning("Slow request %s %s took %.0f ms", request.method, request.full_path, elapsed * 1000)
+
+
+def _authorized(admin_token):
+    if not admin_token:
+        return False
+    return hmac.compare_digest(request.headers.get('X-Admin-Token', '').encode(), admin_token.encode())
+
+
+def _profile_mode():
+    value = (request.args.get('profile') or request.headers.get('X-Sentify-Profile') or '').lower()
+    if value in ('', '0', 'false', 'no'):
+        return None
+    return 'pyinstrument' if value == 'pyinstrument' else 'cprofile'
+
+
+def init_profiling(app):
+    """Register profiling hooks and the admin endpoint on `app` when PROFILING_ENABLED is set"""
+    # Read here rather than at import so values from .env (loaded by app.py) apply
+    if os.getenv('PROFILING_ENABLED', '').lower() not in ('1', 'true', 'yes'):
+        return
+    slow_request_ms = int(os.getenv('SLOW_REQUEST_MS', '2000'))
+    buffer_size = int(os.getenv('SLOW_REQUEST_BUFFER', '50'))
+    sample_interval_ms = int(os.getenv('PROFILE_SAMPLE_INTERVAL_MS', '25'))
+    admin_token = os.getenv('ADMIN_TOKEN')
+
+    monitor = SlowRequestMonitor(slow_request_ms, sample_interval_ms, buffer_size)
+    # cProfile cannot run in two threads of one process at once, so profile one request at a time
+    profile_lock = threading.Lock()
+    logger.info("Profiling enabled: slow requests > %d ms, buffer %d, sampling every %d ms",
+                slow_request_ms, buffer_size, sample_interval_ms)
+    if not admin_token:
+        logger.warning("ADMIN_TOKEN is not set: ?profile and /admin/slow-requests are disabled")
+
+    @app.before_request
+    def start_profiling():
+        start_stage_trace()
+        monitor.begin()
+        g.profile_started = time.perf_counter()
+
+        mode = _profile_mode()
+        if not mode or not _authorized(admin_token):
+            return
+        if mode == 'pyinstrument' and PyinstrumentProfiler is None:
+            mode = 'cprofile'
+        if not profile_lock.acquire(blocking=False):
+            g.profile_busy = True
+            return
+        if mode == 'pyinstrument':
+            profiler = PyinstrumentProfiler()
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        g.profiler = (mode, profiler)
+
+    @app.after_request
+    def finish_profiling(response):
+        stages = stop_stage_trace()
+        monitor.end(response.status_code, stages)
+
+        if getattr(g, 'profile_busy', False):
+            response.headers['X-Sentify-Profile'] = 'busy'
+            return response
+        profiled = g.pop('profiler', None)
+        if profiled is None:
+            return response
+
+        mode, profiler = profiled
+        try:
+            if mode == 'pyinstrument':
+                profiler.stop()
+                report = profiler.output_text(unicode=True, color=False)
+            else:
+                profiler.disable()
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(40)
+                report = stream.getvalue()
+        finally:
+            profile_lock.release()
+
+        return jsonify({
+            'path': request.path,
+            'status': response.status_code,
+            'elapsed_ms': round((time.perf_counter() - g.profile_started) * 1000, 1),
+            'profiler': mode,
+            'stages': [{'stage': stage, 'ms': round(seconds * 1000, 2)} for stage, seconds in stages],
+            'profile': report,
+        })
+
+    @app.teardown_request
+    def cleanup_profiling(exc):
+        # Only does work if after_request was skipped by an unhandled error
+        monitor.discard()
+        profiled = g.pop('profiler', None)
+        if profiled is not None:
+            mode, profiler = profiled
+            if mode == 'pyinstrument':
+                profiler.stop()
+            else:
+                profiler.disable()
+            profile_lock.release()
+
+    @app.route('/admin/slow-requests', methods=['GET', 'DELETE'])
+    def slow_requests():
+        """Dump (GET) or clear (DELETE) the slow-request ring buffer"""
+        if not _authorized(admin_token):
+            return jsonify({"error": "Forbidden"}), 403
+        if request.method == 'DELETE':
+            monitor.records.clear()
+            return jsonify({'cleared': True})
+        return jsonify({
+            'thresholdMs': slow_request_ms,
+            'capacity': monitor.records.maxlen,
+            'requests': list(monitor.records),
+        })
@@ -0,0 +1,247 @@
+"""
+Sentify Backend - Provider Health
+Per-key circuit breakers and a per-provider rolling health score used to order
+provider calls so the fastest healthy provider is tried first and providers with an open
+circuit are skipped without paying their timeout.
+
+Circuit states:
+    closed     calls allowed; opens after CIRCUIT_FAILURE_THRESHOLD consecutive failures
+    open       calls skipped until the cooldown expires
+    half_open  one trial call allowed; success closes, failure re-opens with a doubled cooldown
+"""
+import os
+import threading
+import time
+from collections import deque
+
+from metrics import counter
+
+CIRCUIT_TRANSITIONS = counter(
+    'sentify_circuit_transitions_total', 'Provider circuit breaker state changes', ('provider', 'key', 'state'))
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+
+# Score assumed for a provider with no recent history: ranks it after providers known
+# to answer within a second and before ones known to be slow or failing
+UNTRIED_SCORE = 1.0
+
+# Trial calls that never report back (e.g. an exception before the request) are abandoned after this
+TRIAL_TIMEOUT = 60
+
+
+class CircuitBreaker:
+    """Circuit state for one provider key; keys are rate limited independently"""
+
+    def __init__(self, provider, key, failure_threshold=3, cooldown=30, max_cooldown=300):
+        self.provider = provider
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.cooldown = cooldown
+        self.opened_at = 0.0
+        self.trial_started = None
+        self._lock = threading.Lock()
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            CIRCUIT_TRANSITIONS.inc(provider=self.provider, key=self.key, state=state)
+
+    def available(self, now=None):
+        """True if a call could be made now (does not claim the half-open trial)"""
+        now = now or time.monotonic()
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open':
+                return now - self.opened_at >= self.cooldown
+            return self.trial_started is None or now - self.trial_started >= TRIAL_TIMEOUT
+
+    def acquire(self):
+        """Claim permission for one call; in half-open state only one caller gets it"""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open':
+                if now - self.opened_at < self.cooldown:
+                    return False
+                self._set_state('half_open')
+                self.trial_started = None
+            if self.trial_started is not None and now - self.trial_started < TRIAL_TIMEOUT:
+                return False
+            self.trial_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != 'closed':
+                self._set_state('closed')
+                self.cooldown = self.base_cooldown
+                self.trial_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == 'half_open':
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self._open()
+            elif self.state == 'closed' and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self.trial_started = None
+        self._set_state('open')
+
+    def snapshot(self):
+        with self._lock:
+            return {'state': self.state, 'consecutiveFailures': self.consecutive_failures}
+
+
+class ProviderHealth:
+    """
+    Rolling latency/error/empty-result window for one provider, plus one
+    circuit breaker per API key. The provider counts as available while any
+    of its keys' circuits would let a call through.
+    """
+
+    def __init__(self, name, window=50, max_age=300, failure_threshold=3, cooldown=30, max_cooldown=300):
+        self.name = name
+        self.max_age = max_age
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.calls = deque(maxlen=window)    # (timestamp, latency seconds, succeeded)
+        self.results = deque(maxlen=window)  # (timestamp, True if the call produced no usable data)
+        self.circuits = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, key='key1'):
+        circuit = self.circuits.get(key)
+        if circuit is None:
+            with self._lock:
+                circuit = self.circuits.get(key)
+                if circuit is None:
+                    circuit = self.circuits[key] = CircuitBreaker(
+                        self.name, key, self.failure_threshold, self.cooldown, self.max_cooldown)
+        return circuit
+
+    @property
+    def state(self):
+        """Best state across keys: closed if any key is closed, open only if all are"""
+        states = {circuit.state for circuit in list(self.circuits.values())}
+        if not states or 'closed' in states:
+            return 'closed'
+        return 'half_open' if 'half_open' in states else 'open'
+
+    def available(self, now=None):
+        """True if a call could be made now on at least one key"""
+        circuits = list(self.circuits.values())
+        return not circuits or any(circuit.available(now) for circuit in circuits)
+
+    def acquire(self, key='key1'):
+        """Claim permission for one call with `key`"""
+        return self.circuit(key).acquire()
+
+    def record_success(self, latency, key='key1'):
+        with self._lock:
+            self.calls.append((time.monotonic(), latency, True))
+        self.circuit(key).record_success()
+
+    def record_failure(self, latency, key='key1'):
+        with self._lock:
+            self.calls.append((time.monotonic(), latency, False))
+        self.circuit(key).record_failure()
+
+    def record_result(self, empty):
+        with self._lock:
+            self.results.append((time.monotonic(), empty))
+
+    def _stats(self):
+        """(mean latency, success rate, empty rate, calls) over the window; caller holds the lock"""
+        # Drop stale entries so a provider that was slow a while ago gets re-tried
+        cutoff = time.monotonic() - self.max_age
+        while self.calls and self.calls[0][0] < cutoff:
+            self.calls.popleft()
+        while self.results and self.results[0][0] < cutoff:
+            self.results.popleft()
+        if not self.calls:
+            return None, 1.0, 0.0, 0
+        calls = len(self.calls)
+        latency = sum(l for _, l, _ in self.calls) / calls
+        success_rate = sum(1 for _, _, ok in self.calls if ok) / calls
+        empty_rate = sum(1 for _, empty in self.results if empty) / len(self.results) if self.results else 0.0
+        return latency, success_rate, empty_rate, calls
+
+    def score(self):
+        """
+        Expected seconds to get a usable answer: mean latency divided by the
+        probability of success with data. Lower is better; UNTRIED_SCORE with
+        no recent history.
+        """
+        with self._lock:
+            latency, success_rate, empty_rate, _ = self._stats()
+        if latency is None:
+            return UNTRIED_SCORE
+        return latency / max(0.05, success_rate * (1 - empty_rate))
+
+    def snapshot(self):
+        score = self.score()
+        state = self.state
+        with self._lock:
+            latency, success_rate, empty_rate, calls = self._stats()
+            return {
+                'state': state,
+                'score': round(score, 4),
+                'calls': calls,
+                'errorRate': round(1 - success_rate, 3),
+                'emptyRate': round(empty_rate, 3),
+                'avgLatencyMs': round(latency * 1000, 1) if latency is not None else None,
+                'circuits': {key: circuit.snapshot() for key, circuit in sorted(self.circuits.items())},
+            }
+
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def get_health(name):
+    """Health tracker for `name`, created on first use with settings from the environment"""
+    health = _providers.get(name)
+    if health is None:
+        with _providers_lock:
+            health = _providers.get(name)
+            if health is None:
+                health = _providers[name] = ProviderHealth(
+                    name,
+                    window=int(os.getenv('HEALTH_WINDOW', '50')),
+                    max_age=float(os.getenv('HEALTH_MAX_AGE', '300')),
+                    failure_threshold=int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '3')),
+                    cooldown=float(os.getenv('CIRCUIT_COOLDOWN', '30')),
+                    max_cooldown=float(os.getenv('CIRCUIT_MAX_COOLDOWN', '300')),
+                )
+    return health
+
+
+def order_providers(names):
+    """
+    Return `names` with open circuits removed, sorted best score first.
+    Ties (e.g. no history yet) keep the given order, so the configured order
+    applies until there is data.
+    """
+    now = time.monotonic()
+    candidates = [(get_health(name), idx, name) for idx, name in enumerate(names)]
+    ranked = sorted(((health.score(), idx, name) for health, idx, name in candidates if health.available(now)))
+    return [name for _, _, name in ranked]
+
+
+def health_snapshot():
+    return {name: health.snapshot() for name, health in sorted(_providers.items())}
@@ -0,0 +1,183 @@
+"""
+Sentify Backend - Compact Records
+Struct-of-arrays containers for cached news articles and FinBERT scores, and
+the content-derived article IDs they are keyed by.
+
+One list per field instead of one dict per article, interned source names and
+float32 score columns keep cached news small. Both containers serialize
+straight to JSON (the same shape `jsonify` produced) or NDJSON without
+building a dict per item.
+"""
+import hashlib
+import sys
+from array import array
+from json.encoder import encode_basestring_ascii as _quote
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# FinBERT output order
+SENTIMENT_LABELS = ('positive', 'negative', 'neutral')
+
+# Query parameters that only track where a click came from
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'cmpid', 'ref', 'src', 'source', 'yptr', 'guccounter'}
+
+
+def canonical_url(url):
+    """Normalize a URL so one story gets the same form from every provider"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS)
+    path = parts.path.rstrip('/') or '/'
+    # Scheme is dropped: http and https links to one story are the same story
+    return urlunsplit(('', host, path, urlencode(query), ''))
+
+
+def article_id(url, title=''):
+    """Stable article ID: hash of the canonical URL (of the title when there is no URL)"""
+    key = canonical_url(url) if url else f"title:{(title or '').strip().lower()}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def _js_prefix(text, length):
+    """text.substring(0, length) as JavaScript computes it (UTF-16 code units)"""
+    return text.encode('utf-16-le', 'surrogatepass')[:2 * length].decode('utf-16-le', 'surrogatepass')
+
+
+def scoring_text(title, summary):
+    """
+    The text an article is scored as: the template services/geminiService.ts
+    sends to /api/sentiment/finbert (headline twice, then the summary's first
+    200 characters), so server-side digests match what the frontend scored
+    """
+    return f"HEADLINE: {title}. HEADLINE AGAIN: {title}. Additional context: {_js_prefix(summary, 200)}"
+
+
+def _number(value):
+    return repr(round(value, 4))
+
+
+class ArticleBatch:
+    """
+    Articles stored column-wise; fields match the NewsItem type in types.ts.
+    `scores` holds cached FinBERT results, emitted as `finbert` where present.
+    """
+    __slots__ = ('ids', 'titles', 'sources', 'published', 'urls', 'summaries', 'scores')
+
+    def __init__(self):
+        self.ids = []
+        self.titles = []
+        self.sources = []
+        self.published = []
+        self.urls = []
+        self.summaries = []
+        self.scores = ScoreBatch()
+
+    @classmethod
+    def from_dicts(cls, articles):
+        batch = cls()
+        seen = set()
+        for article in articles:
+            # IDs are content-derived, so a story listed twice collapses to one
+            if article['id'] not in seen:
+                seen.add(article['id'])
+                batch.append(article)
+        return batch
+
+    def append(self, article):
+        # Providers sometimes send null fields; store them as empty strings
+        self.ids.append(article['id'])
+        self.titles.append(article.get('title') or '')
+        # A handful of outlets repeat across thousands of cached articles
+        self.sources.append(sys.intern(article.get('source') or ''))
+        self.published.append(article.get('publishedAt') or '')
+        self.urls.append(article.get('url') or '')
+        self.summaries.append(article.get('summary') or '')
+        self.scores.append(None)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def to_dicts(self):
+        items = []
+        for i in range(len(self)):
+            item = {
+                'id': self.ids[i],
+                'title': self.titles[i],
+                'source': self.sources[i],
+                'publishedAt': self.published[i],
+                'url': self.urls[i],
+                'summary': self.summaries[i],
+            }
+            if self.scores.present[i]:
+                item['finbert'] = self.scores.result(i)
+            items.append(item)
+        return items
+
+    def item_json(self, i):
+        # Keys in sorted order, as jsonify emits them
+        finbert = f'"finbert":{self.scores.item_json(i)},' if self.scores.present[i] else ''
+        return (f'{{{finbert}"id":{_quote(self.ids[i])},"publishedAt":{_quote(self.published[i])},'
+                f'"source":{_quote(self.sources[i])},"summary":{_quote(self.summaries[i])},'
+                f'"title":{_quote(self.titles[i])},"url":{_quote(self.urls[i])}}}')
+
+    def to_json(self):
+        return '[' + ','.join(self.item_json(i) for i in range(len(self))) + ']'
+
+    def to_ndjson(self):
+        return ''.join(self.item_json(i) + '\n' for i in range(len(self)))
+
+
+class ScoreBatch:
+    """FinBERT probabilities as one float32 array (positive, negative, neutral per text)"""
+    __slots__ = ('probabilities', 'present')
+
+    def __init__(self):
+        self.probabilities = array('f')
+        self.present = bytearray()  # 0 where scoring failed (serialized as null)
+
+    def append(self, probabilities):
+        if probabilities is None:
+            self.probabilities.extend((0.0, 0.0, 0.0))
+            self.present.append(0)
+        else:
+            self.probabilities.extend(probabilities)
+            self.present.append(1)
+
+    def set(self, i, probabilities):
+        self.probabilities[3 * i:3 * i + 3] = array('f', probabilities)
+        self.present[i] = 1
+
+    def __len__(self):
+        return len(self.present)
+
+    def _row(self, i):
+        row = self.probabilities[3 * i:3 * i + 3]
+        best = max(range(3), key=row.__getitem__)
+        return row, best
+
+    def result(self, i):
+        """Score i in the analyze_sentiment_finbert dict shape, or None"""
+        if not self.present[i]:
+            return None
+        row, best = self._row(i)
+        return {
+            'sentiment': SENTIMENT_LABELS[best],
+            'confidence': round(row[best], 4),
+            'scores': {label: round(row[k], 4) for k, label in enumerate(SENTIMENT_LABELS)},
+        }
+
+    def item_json(self, i):
+        if not self.present[i]:
+            return 'null'
+        row, best = self._row(i)
+        return (f'{{"confidence":{_number(row[best])},"scores":{{"negative":{_number(row[1])},'
+                f'"neutral":{_number(row[2])},"positive":{_number(row[0])}}},'
+                f'"sentiment":"{SENTIMENT_LABELS[best]}"}}')
+
+    def to_json(self):
+        return '[' + ','.join(self.item_json(i) for i in range(len(self))) + ']'
+
+    def to_ndjson(self):
+        return ''.join(self.item_json(i) + '\n' for i in range(len(self)))
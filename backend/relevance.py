@@ -0,0 +1,54 @@
+"""
+Sentify Backend - News Relevance
+The relevance filter applied to provider articles, shared by /api/news
+(app.py) and the historical backfill (backfill.py) so both score the same
+kind of article set.
+"""
+import re
+
+# Short names used when no company name can be looked up
+COMMON_NAMES = {
+    'AAPL': 'Apple', 'TSLA': 'Tesla', 'GOOGL': 'Google', 'AMZN': 'Amazon',
+    'MSFT': 'Microsoft', 'NVDA': 'NVIDIA', 'META': 'Meta', 'NFLX': 'Netflix',
+    'AMD': 'AMD', 'INTC': 'Intel', 'WMT': 'Walmart', 'JPM': 'JPMorgan',
+    'V': 'Visa', 'MA': 'Mastercard', 'DIS': 'Disney', 'NKE': 'Nike',
+    'SBUX': 'Starbucks', 'PYPL': 'PayPal', 'UBER': 'Uber', 'SPOT': 'Spotify'
+}
+
+
+def is_relevant_news(article, symbol, company_name=None):
+    """
+    Filter news articles to ensure they are directly relevant to the specific company
+    Returns True if article mentions the company/ticker prominently
+    """
+    title = (article.get('title') or '').lower()
+    summary = (article.get('summary') or '').lower()
+    combined_text = f"{title} {summary}"
+
+    symbol_lower = symbol.lower()
+
+    # Check if ticker symbol appears in title or summary
+    if symbol_lower in combined_text:
+        return True
+
+    # If we have company name, check for it
+    if company_name:
+        company_lower = company_name.lower()
+        # Check for full company name or significant parts
+        company_words = company_lower.split()
+
+        # For short company names (1-2 words), require exact match
+        if len(company_words) <= 2:
+            if company_lower in combined_text:
+                return True
+        else:
+            # For longer names, check if at least 2 key words appear
+            matches = sum(1 for word in company_words if len(word) > 3 and word in combined_text)
+            if matches >= 2:
+                return True
+
+    # Additional check: if title contains the symbol as a word (not part of another word)
+    if re.search(rf'\b{re.escape(symbol_lower)}\b', title):
+        return True
+
+    return False
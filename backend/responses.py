@@ -0,0 +1,170 @@
+"""
+Sentify Backend - Responses
+JSON serialization, compression and conditional requests for every endpoint.
+
+- JSON goes through orjson when it is installed (JSON_SERIALIZER=orjson|json,
+  default picks orjson if available), with the same sorted-key output as the
+  stdlib encoder.
+- Responses over COMPRESS_MIN_BYTES are sent brotli- or gzip-encoded when the
+  client accepts it (brotli needs the `brotli` package).
+- GET/HEAD responses carry a weak ETag and answer If-None-Match with 304.
+- CachedBody holds a pre-serialized body plus its ETag and compressed
+  variants, so cache hits skip serialization and compression entirely.
+"""
+import gzip
+import hashlib
+import json
+import os
+import zlib
+
+from flask import Response, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = {'application/json', 'application/x-ndjson', 'text/plain'}
+
+
+def _read_settings():
+    """(Re)read settings; init_responses calls this so values from .env (loaded by app.py) apply"""
+    global SERIALIZER, COMPRESS_MIN_BYTES, GZIP_LEVEL, BROTLI_QUALITY, MAX_REQUEST_BYTES
+    SERIALIZER = os.getenv('JSON_SERIALIZER', 'orjson' if orjson else 'json').lower()
+    if SERIALIZER == 'orjson' and orjson is None:
+        SERIALIZER = 'json'
+    COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', '1024'))
+    GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', '6'))
+    BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', '5'))
+    # Upper bound for gzip-encoded request bodies once decompressed
+    MAX_REQUEST_BYTES = int(os.getenv('MAX_REQUEST_BYTES', str(16 * 1024 * 1024)))
+
+
+_read_settings()
+
+# Datetimes go through Flask's default handler (HTTP date) so output matches the stdlib path
+_ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                   if orjson else 0)
+
+
+def dumps(obj):
+    """Serialize `obj` to compact UTF-8 JSON bytes with sorted keys"""
+    if SERIALIZER == 'orjson':
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=DefaultJSONProvider.default, sort_keys=True, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def loads(data):
+    if SERIALIZER == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by dumps()/loads(), so jsonify() uses the fast path"""
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def negotiate_encoding():
+    """Best content encoding the client accepts: 'br', 'gzip' or None"""
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+
+class CachedBody:
+    """A serialized response body with its ETag and lazily built compressed variants"""
+    __slots__ = ('body', 'mimetype', 'etag', '_encoded')
+
+    def __init__(self, body, mimetype='application/json'):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self._encoded = {}
+
+    def encoded(self, encoding):
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = self._encoded[encoding] = compress(self.body, encoding)
+        return data
+
+    def response(self, status=200):
+        """Response for the current request: 304 (GET/HEAD only), compressed or plain"""
+        if request.method in ('GET', 'HEAD') and request.if_none_match.contains_weak(self.etag):
+            response = Response(status=304)
+            response.set_etag(self.etag, weak=True)
+            return response
+        encoding = negotiate_encoding() if len(self.body) >= COMPRESS_MIN_BYTES else None
+        response = Response(self.encoded(encoding) if encoding else self.body, status=status,
+                            mimetype=self.mimetype)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        response.set_etag(self.etag, weak=True)
+        return response
+
+
+def request_json():
+    """Parse the request body as JSON, accepting `Content-Encoding: gzip` uploads"""
+    data = request.get_data(cache=False)
+    if request.content_encoding == 'gzip':
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            data = decompressor.decompress(data, MAX_REQUEST_BYTES)
+        except zlib.error as e:
+            raise ValueError(f"Invalid gzip request body: {e}")
+        if decompressor.unconsumed_tail:
+            raise ValueError("Decompressed request body too large")
+    return loads(data) if data else None
+
+
+def init_responses(app):
+    """Install the JSON provider and the ETag/compression hook on `app`"""
+    _read_settings()
+    app.json = FastJSONProvider(app)
+
+    # Registered before app.py's metrics and profiling hooks, so it runs after them
+    @app.after_request
+    def finalize_response(response):
+        if (response.status_code != 200 or response.direct_passthrough or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_TYPES):
+            return response
+        if request.method in ('GET', 'HEAD') and not response.get_etag()[0]:
+            response.add_etag(weak=True)
+            response.make_conditional(request)
+            if response.status_code == 304:
+                return response
+        response.vary.add('Accept-Encoding')
+        body = response.get_data()
+        if len(body) < COMPRESS_MIN_BYTES:
+            return response
+        encoding = negotiate_encoding()
+        if encoding:
+            response.set_data(compress(body, encoding))
+            response.headers['Content-Encoding'] = encoding
+        return response
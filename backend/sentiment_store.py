@@ -0,0 +1,121 @@
+"""
+Sentify Backend - Sentiment Store
+SQLite store for backfilled articles with their FinBERT scores, plus per
+symbol/provider checkpoints so `backfill.py` can resume where it stopped.
+Long-range views (/api/sentiment/history) read daily aggregates from here.
+"""
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+from records import SENTIMENT_LABELS
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'sentiment.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    symbol TEXT NOT NULL,
+    id TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    title TEXT,
+    source TEXT,
+    url TEXT,
+    summary TEXT,
+    positive REAL,
+    negative REAL,
+    neutral REAL,
+    sentiment TEXT,
+    PRIMARY KEY (symbol, id)
+);
+CREATE INDEX IF NOT EXISTS articles_symbol_published ON articles (symbol, published_at);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    symbol TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    cursor TEXT,
+    done INTEGER NOT NULL DEFAULT 0,
+    articles INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT,
+    PRIMARY KEY (symbol, provider)
+);
+"""
+
+
+def store_path():
+    return os.getenv('SENTIMENT_STORE_PATH') or DEFAULT_STORE_PATH
+
+
+class SentimentStore:
+    """Thin wrapper over one SQLite connection (not shared between threads)"""
+
+    def __init__(self, path=None, readonly=False):
+        self.path = path or store_path()
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self.conn = sqlite3.connect(self.path)
+            # WAL lets the API read while a backfill is writing
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def checkpoint(self, symbol, provider):
+        row = self.conn.execute(
+            'SELECT cursor, done, articles FROM checkpoints WHERE symbol = ? AND provider = ?',
+            (symbol, provider)).fetchone()
+        if row is None:
+            return None
+        return {'cursor': row[0], 'done': bool(row[1]), 'articles': row[2]}
+
+    def known_ids(self, symbol, ids):
+        """Subset of `ids` already stored for `symbol`"""
+        known = set()
+        ids = list(ids)
+        for offset in range(0, len(ids), 500):
+            chunk = ids[offset:offset + 500]
+            placeholders = ','.join('?' * len(chunk))
+            known.update(row[0] for row in self.conn.execute(
+                f'SELECT id FROM articles WHERE symbol = ? AND id IN ({placeholders})', [symbol, *chunk]))
+        return known
+
+    def save_page(self, symbol, provider, articles, scores, cursor, done):
+        """Store one page of scored articles and advance the checkpoint in a single transaction"""
+        rows = []
+        for article, probabilities in zip(articles, scores):
+            if probabilities is None:
+                positive = negative = neutral = label = None
+            else:
+                positive, negative, neutral = probabilities
+                label = SENTIMENT_LABELS[max(range(3), key=lambda k: probabilities[k])]
+            rows.append((symbol, article['id'], provider, article['publishedAt'], article['title'],
+                         article['source'], article['url'], article['summary'], positive, negative, neutral, label))
+        with self.conn:
+            cur = self.conn.executemany(
+                'INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self.conn.execute(
+                'INSERT INTO checkpoints (symbol, provider, cursor, done, articles, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (symbol, provider) DO UPDATE SET '
+                'cursor = excluded.cursor, done = excluded.done, '
+                'articles = checkpoints.articles + excluded.articles, updated_at = excluded.updated_at',
+                (symbol, provider, cursor, int(done), max(cur.rowcount, 0),
+                 datetime.now(timezone.utc).isoformat(timespec='seconds')))
+
+    def daily_sentiment(self, symbol, since):
+        """Per-day article counts and mean probabilities for `symbol` from `since` (ISO date)"""
+        rows = self.conn.execute(
+            'SELECT substr(published_at, 1, 10) AS day, COUNT(*), AVG(positive), AVG(negative), AVG(neutral), '
+            "SUM(sentiment = 'positive'), SUM(sentiment = 'negative'), SUM(sentiment = 'neutral') "
+            'FROM articles WHERE symbol = ? AND published_at >= ? AND positive IS NOT NULL '
+            'GROUP BY day ORDER BY day', (symbol, since))
+        return [{
+            'date': day,
+            'articles': count,
+            'positive': round(positive, 4),
+            'negative': round(negative, 4),
+            'neutral': round(neutral, 4),
+            'score': round(positive - negative, 4),
+            'counts': {'positive': pos_count, 'negative': neg_count, 'neutral': neu_count},
+        } for day, count, positive, negative, neutral, pos_count, neg_count, neu_count in rows]
@@ -0,0 +1,146 @@
+"""
+Sentify Backend - Production Server
+Runs app.py under gunicorn (Linux/macOS) or waitress (Windows / fallback)
+instead of the single-process Flask development server.
+
+Usage:
+    python serve.py --workers 2 --threads 4 --torch-threads 2
+
+Every option can also be set through the environment (see README.md).
+"""
+import argparse
+import logging
+import os
+import platform
+
+from logging_setup import configure_logging
+
+logger = logging.getLogger('sentify.serve')
+
+
+def env_int(name, default):
+    """Read an integer setting from the environment"""
+    value = os.getenv(name)
+    try:
+        return int(value) if value else default
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r, using %s", name, value, default)
+        return default
+
+
+def parse_args():
+    """Build launcher settings from CLI flags, falling back to SENTIFY_* env vars"""
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Run the Sentify backend in production mode")
+    parser.add_argument('--server', choices=['auto', 'gunicorn', 'waitress'],
+                        default=os.getenv('SENTIFY_SERVER', 'auto'),
+                        help="WSGI server to use (default: gunicorn if available, else waitress)")
+    parser.add_argument('--host', default=os.getenv('SENTIFY_HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=env_int('SENTIFY_PORT', 5000))
+    parser.add_argument('--workers', type=int, default=env_int('SENTIFY_WORKERS', 1),
+                        help="Worker processes (gunicorn only)")
+    parser.add_argument('--threads', type=int, default=env_int('SENTIFY_THREADS', 4),
+                        help="Request threads per worker")
+    parser.add_argument('--torch-threads', type=int, default=env_int('TORCH_NUM_THREADS', 0),
+                        help="Torch intra-op threads per worker (default: cores / workers)")
+    parser.add_argument('--max-requests', type=int, default=env_int('SENTIFY_MAX_REQUESTS', 1000),
+                        help="Recycle a worker after this many requests, 0 disables (gunicorn only)")
+    parser.add_argument('--max-requests-jitter', type=int, default=env_int('SENTIFY_MAX_REQUESTS_JITTER', 100),
+                        help="Random jitter added to --max-requests so workers don't restart together")
+    parser.add_argument('--timeout', type=int, default=env_int('SENTIFY_TIMEOUT', 120),
+                        help="Seconds before a silent worker is killed and restarted (gunicorn only)")
+    args = parser.parse_args()
+    if args.torch_threads <= 0:
+        args.torch_threads = max(1, cpu_count // max(1, args.workers))
+    return args
+
+
+def pick_server(requested):
+    """Resolve 'auto' to gunicorn where it can run, otherwise waitress"""
+    if requested != 'auto':
+        return requested
+    if platform.system() == 'Windows':
+        return 'waitress'
+    try:
+        import gunicorn  # noqa: F401
+        return 'gunicorn'
+    except ImportError:
+        return 'waitress'
+
+
+def run_gunicorn(application, args):
+    """Serve with gunicorn; the model is already loaded so workers share it via fork"""
+    from gunicorn.app.base import BaseApplication
+
+    torch_threads = args.torch_threads
+
+    def post_fork(server, worker):
+        # Fork does not carry the parent's intra-op pool size reliably, so set it again
+        import torch
+        torch.set_num_threads(torch_threads)
+
+    class SentifyApplication(BaseApplication):
+        def __init__(self, wsgi_app, options):
+            self.wsgi_app = wsgi_app
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.wsgi_app
+
+    options = {
+        'bind': f"{args.host}:{args.port}",
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'preload_app': True,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests_jitter if args.max_requests else 0,
+        'timeout': args.timeout,
+        'graceful_timeout': 30,
+        'post_fork': post_fork,
+    }
+    SentifyApplication(application, options).run()
+
+
+def run_waitress(application, args):
+    """Serve with waitress (single process, thread pool)"""
+    from waitress import serve
+
+    if args.workers > 1:
+        logger.warning("waitress runs a single process, ignoring --workers %d", args.workers)
+    if args.max_requests:
+        logger.warning("waitress cannot recycle workers, --max-requests is ignored")
+    serve(application, host=args.host, port=args.port, threads=args.threads)
+
+
+def main():
+    from dotenv import load_dotenv
+
+    # Before parse_args: launcher settings and LOG_LEVEL may come from backend/.env
+    load_dotenv()
+    configure_logging()
+    args = parse_args()
+    server = pick_server(args.server)
+
+    # Must be set before app is imported: the model is loaded at import time
+    os.environ['TORCH_NUM_THREADS'] = str(args.torch_threads)
+
+    logger.info("Starting Sentify Backend (%s): workers=%d threads=%d torch_threads=%d max_requests=%d",
+                server, args.workers, args.threads, args.torch_threads, args.max_requests)
+
+    # Preload: importing app loads FinBERT once, before any worker is forked
+    from app import app as application
+
+    if server == 'gunicorn':
+        run_gunicorn(application, args)
+    else:
+        run_waitress(application, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""
+Sentify Backend - Symbol Index
+In-memory ticker/company search over a local symbol list (data/symbols.csv):
+a sorted-array prefix index over tickers and company names plus trigram fuzzy
+matching. /api/search answers from here and only uses the network for prices.
+
+The bundled list covers popular symbols. Refresh it with the full exchange
+listing from Finnhub (needs FINNHUB_API_KEY):
+    python symbol_index.py download --exchange US
+"""
+import argparse
+import bisect
+import csv
+import logging
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+logger = logging.getLogger('sentify.symbols')
+
+DEFAULT_SYMBOL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'symbols.csv')
+CSV_FIELDS = ['symbol', 'name', 'type', 'popular']
+
+# Same instrument types the Finnhub search path skips
+SKIP_TYPES = {'warrant', 'right', 'index'}
+
+# Prefix scans stop after this many keys (a one-letter query can match thousands);
+# popular symbols are always checked separately so they are never cut off
+PREFIX_SCAN_LIMIT = 300
+# Trigrams shared by more entries than this (e.g. " IN", "INC") carry little signal
+MAX_POSTINGS = 1000
+MIN_FUZZY_SIMILARITY = 0.4
+# Distinct queries whose results are memoized (keystrokes repeat a lot)
+QUERY_CACHE_SIZE = 4096
+
+_NON_ALNUM = re.compile(r'[^A-Z0-9]+')
+
+# Key kinds in the prefix index
+_SYMBOL, _NAME, _NAME_WORD = 0, 1, 2
+
+
+def normalize(text):
+    """Upper-case and collapse punctuation to single spaces: 'Amazon.com, Inc.' -> 'AMAZON COM INC'"""
+    return _NON_ALNUM.sub(' ', text.upper()).strip()
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SymbolIndex:
+    """Prefix + trigram index over (symbol, name) entries"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        keys = []
+        postings = defaultdict(list)
+        for idx, entry in enumerate(entries):
+            symbol = entry['symbol'].upper()
+            name = normalize(entry['name'])
+            keys.append((symbol, _SYMBOL, idx))
+            if name:
+                keys.append((name, _NAME, idx))
+                # Later words too, so 'MOTORS' finds 'GENERAL MOTORS CO'
+                for word in name.split()[1:]:
+                    if len(word) > 1:
+                        keys.append((word, _NAME_WORD, idx))
+            for gram in trigrams(symbol) | trigrams(name):
+                postings[gram].append(idx)
+        keys.sort()
+        self._keys = keys
+        self._key_strings = [key for key, _, _ in keys]
+        self._postings = dict(postings)
+        self._popular_keys = [(key, kind, idx) for key, kind, idx in keys if entries[idx].get('popular')]
+        self._search_cached = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._search)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, query, limit=5):
+        """Return up to `limit` entries ranked by match quality for `query`"""
+        q = normalize(query)
+        if not q:
+            return []
+        return list(self._search_cached(q, limit))
+
+    @staticmethod
+    def _prefix_score(key, kind, q):
+        exact = key == q
+        if kind == _SYMBOL:
+            score = 100 if exact else 80
+        elif kind == _NAME:
+            score = 75 if exact else 60
+        else:
+            score = 50
+        # Prefer keys that are mostly covered by the query
+        return score - min(len(key) - len(q), 20) * 0.5
+
+    def _search(self, q, limit):
+        scores = {}
+        start = bisect.bisect_left(self._key_strings, q)
+        for pos in range(start, min(len(self._keys), start + PREFIX_SCAN_LIMIT)):
+            key, kind, idx = self._keys[pos]
+            if not key.startswith(q):
+                break
+            score = self._prefix_score(key, kind, q)
+            if score > scores.get(idx, -1):
+                scores[idx] = score
+        for key, kind, idx in self._popular_keys:
+            if key.startswith(q):
+                score = self._prefix_score(key, kind, q)
+                if score > scores.get(idx, -1):
+                    scores[idx] = score
+
+        # Fuzzy fallback for typos and mid-word fragments
+        if len(scores) < limit and len(q) >= 3:
+            grams = trigrams(q)
+            shared = defaultdict(int)
+            for gram in grams:
+                entries = self._postings.get(gram)
+                if entries and len(entries) <= MAX_POSTINGS:
+                    for idx in entries:
+                        shared[idx] += 1
+            for idx, count in shared.items():
+                similarity = count / len(grams)
+                if similarity >= MIN_FUZZY_SIMILARITY:
+                    score = 40 * similarity
+                    if score > scores.get(idx, -1):
+                        scores[idx] = score
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-(item[1] + (10 if self.entries[item[0]].get('popular') else 0)),
+                              len(self.entries[item[0]]['symbol']), self.entries[item[0]]['symbol']))
+        return tuple(self.entries[idx] for idx, _ in ranked[:limit])
+
+
+def read_symbol_file(path):
+    """Read symbol rows from CSV, skipping duplicates and non-tradable types"""
+    entries = []
+    seen = set()
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            symbol = (row.get('symbol') or '').strip()
+            if not symbol or symbol in seen or (row.get('type') or '').strip().lower() in SKIP_TYPES:
+                continue
+            seen.add(symbol)
+            entries.append({
+                'symbol': symbol,
+                'name': (row.get('name') or symbol).strip(),
+                'type': (row.get('type') or '').strip(),
+                'popular': (row.get('popular') or '').strip() == '1',
+            })
+    return entries
+
+
+def load_symbol_index(path=None):
+    """Build the index from `path` (default data/symbols.csv); empty index if the file is missing"""
+    path = path or DEFAULT_SYMBOL_PATH
+    try:
+        entries = read_symbol_file(path)
+    except OSError as e:
+        logger.warning("Symbol list %s not readable (%s), local search disabled", path, e)
+        entries = []
+    return SymbolIndex(entries)
+
+
+def download_symbols(api_key, exchanges, path, base_url):
+    """Fetch full symbol listings from Finnhub and write them to `path`, keeping popular flags"""
+    import requests
+
+    popular = {}
+    if os.path.exists(path):
+        popular = {e['symbol']: e for e in read_symbol_file(path) if e['popular']}
+
+    rows = {symbol: entry for symbol, entry in popular.items()}
+    for exchange in exchanges:
+        response = requests.get(f"{base_url}/stock/symbol", params={'exchange': exchange, 'token': api_key},
+                                timeout=60)
+        response.raise_for_status()
+        listing = response.json()
+        for item in listing:
+            symbol = item.get('symbol')
+            if not symbol or symbol in rows:
+                continue
+            rows[symbol] = {'symbol': symbol, 'name': item.get('description') or symbol,
+                            'type': item.get('type', ''), 'popular': False}
+        logger.info("Finnhub %s: %d symbols", exchange, len(listing))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for entry in rows.values():
+            writer.writerow({**entry, 'popular': '1' if entry['popular'] else '0'})
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+def main():
+    from dotenv import load_dotenv
+    from logging_setup import configure_logging
+
+    load_dotenv()
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Manage the local symbol list used by /api/search")
+    sub = parser.add_subparsers(dest='command', required=True)
+    download = sub.add_parser('download', help="Download symbol listings from Finnhub")
+    download.add_argument('--exchange', action='append', default=None,
+                          help="Exchange code (repeatable, default US)")
+    download.add_argument('--path', default=os.getenv('SYMBOL_LIST_PATH') or DEFAULT_SYMBOL_PATH)
+    search = sub.add_parser('search', help="Query the local index")
+    search.add_argument('query')
+    search.add_argument('--path', default=os.getenv('SYMBOL_LIST_PATH') or DEFAULT_SYMBOL_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'download':
+        api_key = os.getenv('FINNHUB_API_KEY') or os.getenv('FINNHUB_API_KEY_2')
+        if not api_key:
+            parser.error("FINNHUB_API_KEY is required to download symbols")
+        base_url = os.getenv('FINNHUB_BASE_URL', 'https://finnhub.io/api/v1')
+        count = download_symbols(api_key, args.exchange or ['US'], args.path, base_url)
+        logger.info("Wrote %d symbols to %s", count, args.path)
+    else:
+        for entry in load_symbol_index(args.path).search(args.query, limit=10):
+            print(f"{entry['symbol']:<10} {entry['name']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,10 @@ export interface FinBERTSentiment {
   };
 }
 
+/**
+ * Score texts with FinBERT. The backend caches each result by text, so an
+ * article scored once comes back with its `finbert` score from /api/news.
+ */
 export async function analyzeWithFinBERT(texts: string[]): Promise<FinBERTSentiment[]> {
   try {
     const response = await fetch(`${API_BASE_URL}/api/sentiment/finbert`, {
@@ -74,8 +74,14 @@ export const analyzeNewsBatch = async (
     try {
       // Give more weight to headline by mentioning it twice to emphasize primary sentiment
       const texts = news.map(item => `HEADLINE: ${item.title}. HEADLINE AGAIN: ${item.title}. Additional context: ${item.summary.substring(0, 200)}`);
-      finbertResults = await analyzeWithFinBERT(texts);
-      console.log(`✓ FinBERT analyzed ${finbertResults.length} articles`);
+      // Articles the backend has already scored arrive with `finbert`; only send the rest
+      finbertResults = news.map(item => item.finbert);
+      const pending = news.map((_, i) => i).filter(i => !news[i].finbert);
+      if (pending.length > 0) {
+        const scored = await analyzeWithFinBERT(pending.map(i => texts[i]));
+        pending.forEach((newsIndex, k) => { finbertResults[newsIndex] = scored[k]; });
+      }
+      console.log(`✓ FinBERT analyzed ${pending.length} articles (${news.length - pending.length} cached)`);
     } catch (error) {
       console.error("FinBERT batch analysis failed:", error);
     }
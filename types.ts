@@ -11,6 +11,16 @@ export interface NewsItem {
   publishedAt: string;
   url: string;
   summary: string;
+  // FinBERT result cached by the backend, present once this article has been scored
+  finbert?: {
+    sentiment: 'positive' | 'negative' | 'neutral';
+    confidence: number;
+    scores: {
+      positive: number;
+      negative: number;
+      neutral: number;
+    };
+  };
 }
 
 export interface ModelSentimentResult {